@@ -13,13 +13,14 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.mcp_servers.main_server import main as server_main
+from src.mcp_servers.main_server import main as server_main, use_uvloop
 from src.cli import cli
 
 
 def run_server():
     """Run the MCP server."""
     print("Starting Agentic Ecosystem MCP Server...")
+    use_uvloop()
     asyncio.run(server_main())
 
 
@@ -1,23 +1,219 @@
+import copy
+import hashlib
+import importlib.util
 import json
 import os
+import re
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
+import httpx
+from langchain_core.messages import AIMessage
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
 
+from .llm_cache import LLMCache
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional; delimiter counting falls back to str.count
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; artifact serialisation falls back to the stdlib json module
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Shared HTTP clients so every LLM call reuses pooled keep-alive connections
+# instead of paying a fresh TLS handshake. HTTP/2 needs the optional h2 package.
+_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+http_client = httpx.Client(http2=_HTTP2_ENABLED, timeout=60, limits=_HTTP_LIMITS)
+http_async_client = httpx.AsyncClient(http2=_HTTP2_ENABLED, timeout=60, limits=_HTTP_LIMITS)
+
 # Initialize LLM with API key from environment
 try:
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+    llm = ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0.1,
+        http_client=http_client,
+        http_async_client=http_async_client
+    )
     print("LLM initialized successfully")
 except Exception as e:
     print(f"Failed to initialize LLM: {e}")
     llm = None
 
+# Upper bound on the number of file names listed verbatim in a prompt
+_MAX_PROMPT_FILES = 50
+
+# In-flight LLM calls keyed by prompt digest. Concurrent identical prompts (e.g. a
+# burst of projects created from the same specification) share one request.
+_inflight_lock = threading.Lock()
+_inflight_calls: Dict[str, Future] = {}
+
+# Persistent LLM response cache, off unless LLM_CACHE_TTL (seconds) is set
+_llm_cache = LLMCache(
+    Path(__file__).parent.parent.parent / ".cache" / "llm",
+    ttl=float(os.getenv("LLM_CACHE_TTL", "0"))
+)
+
+
+def _invoke_llm(prompt: str) -> Any:
+    """Invoke the LLM, coalescing concurrent calls that send an identical prompt.
+    
+    When the response cache is enabled a prompt answered within the TTL is served
+    from disk without contacting the LLM. Responses are only stored once the caller
+    has parsed them, via _cache_llm_response.
+    """
+    if _llm_cache.enabled:
+        cached = _llm_cache.get(_llm_cache.cache_key(llm.model_name, prompt))
+        if cached is not None:
+            return AIMessage(content=cached, response_metadata={"from_cache": True})
+    
+    key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    with _inflight_lock:
+        future = _inflight_calls.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight_calls[key] = Future()
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        response = llm.invoke(prompt)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(response)
+        return response
+    finally:
+        with _inflight_lock:
+            _inflight_calls.pop(key, None)
+
+
+def _cache_llm_response(prompt: str, response: Any) -> None:
+    """Store a response its caller has parsed and validated, when the cache is enabled.
+    
+    Caching only usable replies keeps a truncated or malformed one from being served
+    for the whole TTL. Replies that were themselves served from the cache are not
+    stored again, so their TTL is not extended.
+    """
+    if not _llm_cache.enabled or not isinstance(response.content, str):
+        return
+    if getattr(response, "response_metadata", {}).get("from_cache"):
+        return
+    _llm_cache.set(_llm_cache.cache_key(llm.model_name, prompt), response.content)
+
+# Fallback test strategies used when the LLM is unavailable. Built once at import
+# time rather than re-constructed on every failed call.
+_HTML_FALLBACK_STRATEGY: Mapping[str, Any] = MappingProxyType({
+    "testing_approach": "Static web application testing with focus on functionality, compatibility, and user experience",
+    "test_categories": [
+        {
+            "category": "HTML Validation",
+            "description": "Validate HTML structure, semantics, and accessibility",
+            "priority": "High",
+            "automation": True,
+            "tools_recommended": ["HTML Validator", "axe-core", "WAVE"]
+        },
+        {
+            "category": "CSS Testing",
+            "description": "Test styling, responsiveness, and cross-browser compatibility",
+            "priority": "Medium",
+            "automation": True,
+            "tools_recommended": ["CSS Validator", "BackstopJS", "Percy"]
+        },
+        {
+            "category": "JavaScript Functionality",
+            "description": "Test interactive features and calculations",
+            "priority": "High",
+            "automation": True,
+            "tools_recommended": ["Jest", "Cypress", "Playwright"]
+        },
+        {
+            "category": "Cross-Browser Testing",
+            "description": "Ensure compatibility across different browsers",
+            "priority": "High",
+            "automation": False,
+            "tools_recommended": ["BrowserStack", "Sauce Labs"]
+        }
+    ],
+    "specific_test_cases": [
+        {
+            "test_id": "TC001",
+            "title": "Basic Calculation Test",
+            "description": "Verify basic arithmetic operations work correctly",
+            "steps": ["Enter first number", "Select operation", "Enter second number", "Press equals"],
+            "expected_result": "Correct calculation result displayed",
+            "priority": "High",
+            "type": "Functional"
+        },
+        {
+            "test_id": "TC002", 
+            "title": "Keyboard Input Test",
+            "description": "Verify keyboard shortcuts work properly",
+            "steps": ["Use keyboard to input numbers", "Use keyboard shortcuts for operations"],
+            "expected_result": "All keyboard inputs function correctly",
+            "priority": "Medium",
+            "type": "Usability"
+        }
+    ],
+    "automation_strategy": {
+        "framework_recommendation": "Cypress for E2E testing",
+        "automation_percentage": "80%",
+        "ci_cd_integration": "GitHub Actions workflow",
+        "tools": ["Cypress", "Jest", "HTML Validator"]
+    }
+})
+
+_REACT_FALLBACK_STRATEGY: Mapping[str, Any] = MappingProxyType({
+    "testing_approach": "React component testing with unit tests, integration tests, and E2E testing",
+    "test_categories": [
+        {
+            "category": "Unit Tests",
+            "description": "Test individual React components in isolation",
+            "priority": "High",
+            "automation": True,
+            "tools_recommended": ["Jest", "React Testing Library"]
+        },
+        {
+            "category": "Integration Tests",
+            "description": "Test component interactions and state management",
+            "priority": "High",
+            "automation": True,
+            "tools_recommended": ["Jest", "React Testing Library", "MSW"]
+        },
+        {
+            "category": "E2E Tests",
+            "description": "Test complete user workflows",
+            "priority": "Medium",
+            "automation": True,
+            "tools_recommended": ["Cypress", "Playwright", "Puppeteer"]
+        }
+    ],
+    "automation_strategy": {
+        "framework_recommendation": "Jest + React Testing Library",
+        "automation_percentage": "90%",
+        "ci_cd_integration": "GitHub Actions with test coverage reporting",
+        "tools": ["Jest", "React Testing Library", "Cypress"]
+    }
+})
+
+
 @tool
 def analyze_business_requirements(specification: str, project_id: str) -> Dict[str, Any]:
     """
@@ -56,10 +252,11 @@ def analyze_business_requirements(specification: str, project_id: str) -> Dict[s
         if llm is None:
             raise Exception("LLM not initialized - check API key configuration")
             
-        response = llm.invoke(prompt)
+        response = _invoke_llm(prompt)
         
         try:
             result = json.loads(response.content)
+            _cache_llm_response(prompt, response)
         except json.JSONDecodeError:
             print("JSON parsing failed, using fallback")
             # Fallback if JSON parsing fails
@@ -208,7 +405,7 @@ def design_system_architecture(user_stories: str, project_id: str, requirements:
             if llm is None:
                 raise Exception("LLM not initialized - check API key configuration")
                 
-            response = llm.invoke(system_prompt)
+            response = _invoke_llm(system_prompt)
             print(f"LLM Response received: {len(response.content)} characters")
             
             # Clean the response content more thoroughly
@@ -245,6 +442,7 @@ def design_system_architecture(user_stories: str, project_id: str, requirements:
                 raise ValueError("Invalid LLM response format - missing complexity_analysis")
                 
             print(f"LLM analysis successful: {result.get('complexity_analysis', 'unknown')} complexity")
+            _cache_llm_response(system_prompt, response)
                 
         except Exception as llm_error:
             print(f"LLM call failed: {llm_error}")
@@ -486,7 +684,7 @@ def generate_implementation_plan(architecture: str, project_id: str) -> Dict[str
             if llm is None:
                 raise Exception("LLM not initialized")
                 
-            response = llm.invoke(implementation_prompt)
+            response = _invoke_llm(implementation_prompt)
             print(f"Implementation plan LLM response: {len(response.content)} characters")
             
             # Clean response
@@ -506,6 +704,7 @@ def generate_implementation_plan(architecture: str, project_id: str) -> Dict[str
                 raise ValueError("Invalid implementation plan format")
                 
             print("LLM implementation plan generated successfully")
+            _cache_llm_response(implementation_prompt, response)
             
         except Exception as llm_error:
             print(f"LLM implementation planning failed: {llm_error}")
@@ -616,8 +815,7 @@ def generate_implementation_plan(architecture: str, project_id: str) -> Dict[str
         result["created_by"] = "developer_agent"
         
         # Save source files as individual artifacts
-        for filename, content in source_files.items():
-            _save_source_file(project_id, filename, content)
+        _save_source_files(project_id, source_files)
         
         # Create a README.md file for the project
         readme_content = f"""# {project_id.replace('-', ' ').title()} Project
@@ -660,7 +858,7 @@ project_{project_id}/
 - **Agent**: Developer Agent
 - **Technology**: {tech_used}
 """
-        _save_source_file(project_id, "README.md", readme_content)
+        _save_source_files(project_id, {"README.md": readme_content})
         
         # Update the result to include the README
         result["source_files"]["README.md"] = readme_content
@@ -704,12 +902,23 @@ def create_test_strategy(implementation_plan: str, project_id: str) -> Dict[str,
             project_structure = {}
             implementation_phases = []
 
+        # Summarise the file list as a bounded, order-independent listing plus a
+        # fingerprint so the prompt stays small and stable across key reorders
+        if source_files:
+            sorted_files = sorted(source_files)
+            files_fingerprint = hashlib.blake2b(
+                json.dumps(sorted_files).encode("utf-8"), digest_size=8
+            ).hexdigest()
+            files_summary = f"{sorted_files[:_MAX_PROMPT_FILES]} ({len(sorted_files)} files, fingerprint {files_fingerprint})"
+        else:
+            files_summary = "Not available"
+
         # Use LLM to create intelligent test strategy
         test_strategy_prompt = f"""
         You are a QA Engineer. Create a comprehensive testing strategy based on this implementation plan:
 
         Technology Used: {tech_used}
-        Source Files: {list(source_files.keys()) if source_files else 'Not available'}
+        Source Files: {files_summary}
         Project Structure: {project_structure}
         Implementation Phases: {[phase.get('phase', '') for phase in implementation_phases]}
 
@@ -780,7 +989,7 @@ def create_test_strategy(implementation_plan: str, project_id: str) -> Dict[str,
             if llm is None:
                 raise Exception("LLM not initialized")
                 
-            response = llm.invoke(test_strategy_prompt)
+            response = _invoke_llm(test_strategy_prompt)
             print(f"Test strategy LLM response: {len(response.content)} characters")
             
             # Clean response
@@ -800,104 +1009,15 @@ def create_test_strategy(implementation_plan: str, project_id: str) -> Dict[str,
                 raise ValueError("Invalid test strategy format")
                 
             print("LLM test strategy generated successfully")
+            _cache_llm_response(test_strategy_prompt, response)
             
         except Exception as llm_error:
             print(f"LLM test strategy generation failed: {llm_error}")
             
             # Intelligent fallback based on technology
-            if tech_used == "HTML/CSS/JavaScript":
-                strategy_result = {
-                    "testing_approach": "Static web application testing with focus on functionality, compatibility, and user experience",
-                    "test_categories": [
-                        {
-                            "category": "HTML Validation",
-                            "description": "Validate HTML structure, semantics, and accessibility",
-                            "priority": "High",
-                            "automation": True,
-                            "tools_recommended": ["HTML Validator", "axe-core", "WAVE"]
-                        },
-                        {
-                            "category": "CSS Testing",
-                            "description": "Test styling, responsiveness, and cross-browser compatibility",
-                            "priority": "Medium",
-                            "automation": True,
-                            "tools_recommended": ["CSS Validator", "BackstopJS", "Percy"]
-                        },
-                        {
-                            "category": "JavaScript Functionality",
-                            "description": "Test interactive features and calculations",
-                            "priority": "High",
-                            "automation": True,
-                            "tools_recommended": ["Jest", "Cypress", "Playwright"]
-                        },
-                        {
-                            "category": "Cross-Browser Testing",
-                            "description": "Ensure compatibility across different browsers",
-                            "priority": "High",
-                            "automation": False,
-                            "tools_recommended": ["BrowserStack", "Sauce Labs"]
-                        }
-                    ],
-                    "specific_test_cases": [
-                        {
-                            "test_id": "TC001",
-                            "title": "Basic Calculation Test",
-                            "description": "Verify basic arithmetic operations work correctly",
-                            "steps": ["Enter first number", "Select operation", "Enter second number", "Press equals"],
-                            "expected_result": "Correct calculation result displayed",
-                            "priority": "High",
-                            "type": "Functional"
-                        },
-                        {
-                            "test_id": "TC002", 
-                            "title": "Keyboard Input Test",
-                            "description": "Verify keyboard shortcuts work properly",
-                            "steps": ["Use keyboard to input numbers", "Use keyboard shortcuts for operations"],
-                            "expected_result": "All keyboard inputs function correctly",
-                            "priority": "Medium",
-                            "type": "Usability"
-                        }
-                    ],
-                    "automation_strategy": {
-                        "framework_recommendation": "Cypress for E2E testing",
-                        "automation_percentage": "80%",
-                        "ci_cd_integration": "GitHub Actions workflow",
-                        "tools": ["Cypress", "Jest", "HTML Validator"]
-                    }
-                }
-            else:
-                strategy_result = {
-                    "testing_approach": "React component testing with unit tests, integration tests, and E2E testing",
-                    "test_categories": [
-                        {
-                            "category": "Unit Tests",
-                            "description": "Test individual React components in isolation",
-                            "priority": "High",
-                            "automation": True,
-                            "tools_recommended": ["Jest", "React Testing Library"]
-                        },
-                        {
-                            "category": "Integration Tests",
-                            "description": "Test component interactions and state management",
-                            "priority": "High",
-                            "automation": True,
-                            "tools_recommended": ["Jest", "React Testing Library", "MSW"]
-                        },
-                        {
-                            "category": "E2E Tests",
-                            "description": "Test complete user workflows",
-                            "priority": "Medium",
-                            "automation": True,
-                            "tools_recommended": ["Cypress", "Playwright", "Puppeteer"]
-                        }
-                    ],
-                    "automation_strategy": {
-                        "framework_recommendation": "Jest + React Testing Library",
-                        "automation_percentage": "90%",
-                        "ci_cd_integration": "GitHub Actions with test coverage reporting",
-                        "tools": ["Jest", "React Testing Library", "Cypress"]
-                    }
-                }
+            fallback = _HTML_FALLBACK_STRATEGY if tech_used == "HTML/CSS/JavaScript" else _REACT_FALLBACK_STRATEGY
+            # Nested lists/dicts end up in the returned result, so hand out a private copy
+            strategy_result = copy.deepcopy(dict(fallback))
 
         # Run actual tests on the source files
         test_execution_results = _test_source_files(source_files, tech_used)
@@ -932,6 +1052,78 @@ def create_test_strategy(implementation_plan: str, project_id: str) -> Dict[str,
         }
 
 
+# Disk cache of LLM-generated web app code, keyed by a digest of the inputs that
+# shape the code generation prompt. It shares the LLM_CACHE_TTL opt-in and expiry
+# with the response cache. Code is stored only after _request_generated_code has
+# validated it, and that path never passes the raw reply to _cache_llm_response,
+# so neither a malformed reply nor the template fallback is pinned in either cache.
+_codegen_cache = LLMCache(
+    Path(__file__).parent.parent.parent / ".cache" / "codegen",
+    ttl=_llm_cache.ttl
+)
+
+
+def _codegen_cache_key(overview: str, components: Any, tech_stack: Any) -> str:
+    """Build a stable cache key for a code generation request."""
+    payload = json.dumps([overview, components, tech_stack], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _load_cached_code(cache_key: str) -> Optional[Dict[str, str]]:
+    """Return code generated for this key within the cache TTL, or None."""
+    if not _codegen_cache.enabled:
+        return None
+    cached = _codegen_cache.get(cache_key)
+    if cached is None:
+        return None
+    try:
+        return json.loads(cached)
+    except json.JSONDecodeError:
+        return None
+
+
+def _store_cached_code(cache_key: str, generated_code: Dict[str, str]) -> None:
+    """Cache validated generated code when the cache is enabled."""
+    if _codegen_cache.enabled:
+        _codegen_cache.set(cache_key, json.dumps(generated_code, ensure_ascii=False))
+
+
+def _request_generated_code(code_generation_prompt: str) -> Dict[str, str]:
+    """Ask the LLM for the HTML/CSS/JS files and validate the response."""
+    if llm is None:
+        raise Exception("LLM not initialized")
+        
+    response = _invoke_llm(code_generation_prompt)
+    print(f"Code generation LLM response: {len(response.content)} characters")
+    
+    # Clean response
+    content = response.content.strip()
+    if content.startswith('```json'):
+        content = content[7:]
+    if content.startswith('```'):
+        content = content[3:]
+    if content.endswith('```'):
+        content = content[:-3]
+    content = content.strip()
+    
+    # Try to find JSON within the response
+    if not content.startswith('{'):
+        start_idx = content.find('{')
+        if start_idx != -1:
+            end_idx = content.rfind('}')
+            if end_idx != -1:
+                content = content[start_idx:end_idx+1]
+    
+    generated_code = json.loads(content)
+    
+    # Validate that we got the required files
+    if "index.html" not in generated_code or "styles.css" not in generated_code or "script.js" not in generated_code:
+        raise ValueError("LLM didn't generate all required files")
+        
+    print("✅ LLM generated project-specific code successfully")
+    return generated_code
+
+
 def _generate_simple_web_app(project_id: str, overview: str, architecture_data: Dict[str, Any]) -> Dict[str, str]:
     """Generate HTML/CSS/JS application based on project requirements using LLM."""
     
@@ -971,38 +1163,16 @@ def _generate_simple_web_app(project_id: str, overview: str, architecture_data:
     }}
     """
 
+    # Identical specs yield identical prompts, so reuse code generated earlier
+    cache_key = _codegen_cache_key(overview, components, tech_stack)
+
     try:
-        if llm is None:
-            raise Exception("LLM not initialized")
-            
-        response = llm.invoke(code_generation_prompt)
-        print(f"Code generation LLM response: {len(response.content)} characters")
-        
-        # Clean response
-        content = response.content.strip()
-        if content.startswith('```json'):
-            content = content[7:]
-        if content.startswith('```'):
-            content = content[3:]
-        if content.endswith('```'):
-            content = content[:-3]
-        content = content.strip()
-        
-        # Try to find JSON within the response
-        if not content.startswith('{'):
-            start_idx = content.find('{')
-            if start_idx != -1:
-                end_idx = content.rfind('}')
-                if end_idx != -1:
-                    content = content[start_idx:end_idx+1]
-        
-        generated_code = json.loads(content)
-        
-        # Validate that we got the required files
-        if "index.html" not in generated_code or "styles.css" not in generated_code or "script.js" not in generated_code:
-            raise ValueError("LLM didn't generate all required files")
-            
-        print("✅ LLM generated project-specific code successfully")
+        generated_code = _load_cached_code(cache_key)
+        if generated_code is not None:
+            print("✅ Reusing cached project-specific code")
+        else:
+            generated_code = _request_generated_code(code_generation_prompt)
+            _store_cached_code(cache_key, generated_code)
         
         # Add a README for the generated project
         generated_code["README.md"] = f"""# {project_id.replace('-', ' ').title().replace('_', ' ')} Project
@@ -1054,52 +1224,30 @@ This project was automatically generated by the Agentic Ecosystem.
             return _generate_generic_template(overview)
 
 
-def _generate_calculator_template() -> Dict[str, str]:
-    """Generate calculator template."""
-    return {
-        "index.html": '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Calculator</title>
-    <link rel="stylesheet" href="styles.css">
-</head>
-<body>
-    <div class="calculator">
-        <div class="display">
-            <input type="text" id="display" readonly>
-        </div>
-        <div class="buttons">
-            <button onclick="clearDisplay()">C</button>
-            <button onclick="deleteLast()">←</button>
-            <button onclick="appendToDisplay('/')" class="operator">÷</button>
-            <button onclick="appendToDisplay('*')" class="operator">×</button>
-            
-            <button onclick="appendToDisplay('7')">7</button>
-            <button onclick="appendToDisplay('8')">8</button>
-            <button onclick="appendToDisplay('9')">9</button>
-            <button onclick="appendToDisplay('-')" class="operator">-</button>
-            
-            <button onclick="appendToDisplay('4')">4</button>
-            <button onclick="appendToDisplay('5')">5</button>
-            <button onclick="appendToDisplay('6')">6</button>
-            <button onclick="appendToDisplay('+')" class="operator">+</button>
-            
-            <button onclick="appendToDisplay('1')">1</button>
-            <button onclick="appendToDisplay('2')">2</button>
-            <button onclick="appendToDisplay('3')">3</button>
-            <button onclick="calculate()" class="equals">=</button>
-            
-            <button onclick="appendToDisplay('0')" class="zero">0</button>
-            <button onclick="appendToDisplay('.')">.</button>
-        </div>
-    </div>
-    <script src="script.js"></script>
-</body>
-</html>''',
+# Template CSS/JS is minified once at import in production so every generated
+# project writes the smaller payload. Development keeps the readable source.
+_MINIFY_TEMPLATES = os.getenv("ENV", "").lower() in ("prod", "production")
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a CSS template (production only)."""
+    if not _MINIFY_TEMPLATES:
+        return css
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return re.sub(r':\s+', ':', css).strip()
+
+
+def _minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line comments from a JS template (production only)."""
+    if not _MINIFY_TEMPLATES:
+        return js
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
 
-        "styles.css": '''* {
+
+_CALCULATOR_CSS = _minify_css('''* {
     margin: 0;
     padding: 0;
     box-sizing: border-box;
@@ -1174,9 +1322,9 @@ button:hover {
 
 .zero {
     grid-column: span 2;
-}''',
+}''')
 
-        "script.js": '''let display = document.getElementById('display');
+_CALCULATOR_JS = _minify_js('''let display = document.getElementById('display');
 
 function appendToDisplay(value) {
     if (display.value === '0' && value !== '.') {
@@ -1239,35 +1387,61 @@ document.addEventListener('keydown', function(event) {
     } else if (key === 'Backspace') {
         deleteLast();
     }
-});'''
-    }
+});''')
 
 
-def _generate_todo_template() -> Dict[str, str]:
-    """Generate todo list template."""
+def _generate_calculator_template() -> Dict[str, str]:
+    """Generate calculator template."""
     return {
         "index.html": '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Todo List</title>
+    <title>Calculator</title>
     <link rel="stylesheet" href="styles.css">
 </head>
 <body>
-    <div class="container">
-        <h1>My Todo List</h1>
-        <div class="input-container">
-            <input type="text" id="taskInput" placeholder="Add a new task...">
-            <button onclick="addTask()">Add</button>
+    <div class="calculator">
+        <div class="display">
+            <input type="text" id="display" readonly>
+        </div>
+        <div class="buttons">
+            <button onclick="clearDisplay()">C</button>
+            <button onclick="deleteLast()">←</button>
+            <button onclick="appendToDisplay('/')" class="operator">÷</button>
+            <button onclick="appendToDisplay('*')" class="operator">×</button>
+            
+            <button onclick="appendToDisplay('7')">7</button>
+            <button onclick="appendToDisplay('8')">8</button>
+            <button onclick="appendToDisplay('9')">9</button>
+            <button onclick="appendToDisplay('-')" class="operator">-</button>
+            
+            <button onclick="appendToDisplay('4')">4</button>
+            <button onclick="appendToDisplay('5')">5</button>
+            <button onclick="appendToDisplay('6')">6</button>
+            <button onclick="appendToDisplay('+')" class="operator">+</button>
+            
+            <button onclick="appendToDisplay('1')">1</button>
+            <button onclick="appendToDisplay('2')">2</button>
+            <button onclick="appendToDisplay('3')">3</button>
+            <button onclick="calculate()" class="equals">=</button>
+            
+            <button onclick="appendToDisplay('0')" class="zero">0</button>
+            <button onclick="appendToDisplay('.')">.</button>
         </div>
-        <ul id="taskList"></ul>
     </div>
     <script src="script.js"></script>
 </body>
 </html>''',
 
-        "styles.css": '''* {
+        "styles.css": _CALCULATOR_CSS,
+
+        "script.js": _CALCULATOR_JS
+    }
+
+
+_TODO_CSS = _minify_css('''* {
     margin: 0;
     padding: 0;
     box-sizing: border-box;
@@ -1359,9 +1533,9 @@ button:hover {
     background: #e17055;
     padding: 5px 10px;
     font-size: 14px;
-}''',
+}''')
 
-        "script.js": '''let tasks = JSON.parse(localStorage.getItem('tasks')) || [];
+_TODO_JS = _minify_js('''let tasks = JSON.parse(localStorage.getItem('tasks')) || [];
 
 function saveTasks() {
     localStorage.setItem('tasks', JSON.stringify(tasks));
@@ -1419,71 +1593,40 @@ document.getElementById('taskInput').addEventListener('keypress', function(e) {
 });
 
 // Initial render
-renderTasks();'''
-    }
+renderTasks();''')
 
 
-def _generate_generic_template(overview: str) -> Dict[str, str]:
-    """Generate generic landing page template."""
+def _generate_todo_template() -> Dict[str, str]:
+    """Generate todo list template."""
     return {
-        "index.html": f'''<!DOCTYPE html>
+        "index.html": '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Web Application</title>
+    <title>Todo List</title>
     <link rel="stylesheet" href="styles.css">
 </head>
 <body>
-    <header>
-        <nav>
-            <h1>My App</h1>
-            <ul>
-                <li><a href="#home">Home</a></li>
-                <li><a href="#features">Features</a></li>
-                <li><a href="#about">About</a></li>
-                <li><a href="#contact">Contact</a></li>
-            </ul>
-        </nav>
-    </header>
-    
-    <main>
-        <section id="home" class="hero">
-            <div class="hero-content">
-                <h2>Welcome to Our Application</h2>
-                <p>{overview}</p>
-                <button class="cta-button">Get Started</button>
-            </div>
-        </section>
-        
-        <section id="features" class="features">
-            <h2>Features</h2>
-            <div class="feature-grid">
-                <div class="feature-card">
-                    <h3>Feature 1</h3>
-                    <p>Description of feature 1</p>
-                </div>
-                <div class="feature-card">
-                    <h3>Feature 2</h3>
-                    <p>Description of feature 2</p>
-                </div>
-                <div class="feature-card">
-                    <h3>Feature 3</h3>
-                    <p>Description of feature 3</p>
-                </div>
-            </div>
-        </section>
-    </main>
-    
-    <footer>
-        <p>&copy; 2025 Web Application. All rights reserved.</p>
-    </footer>
-    
+    <div class="container">
+        <h1>My Todo List</h1>
+        <div class="input-container">
+            <input type="text" id="taskInput" placeholder="Add a new task...">
+            <button onclick="addTask()">Add</button>
+        </div>
+        <ul id="taskList"></ul>
+    </div>
     <script src="script.js"></script>
 </body>
 </html>''',
 
-        "styles.css": '''* {
+        "styles.css": _TODO_CSS,
+
+        "script.js": _TODO_JS
+    }
+
+
+_GENERIC_CSS = _minify_css('''* {
     margin: 0;
     padding: 0;
     box-sizing: border-box;
@@ -1625,9 +1768,9 @@ footer {
     .feature-grid {
         grid-template-columns: 1fr;
     }
-}''',
+}''')
 
-        "script.js": '''// Smooth scrolling for navigation links
+_GENERIC_JS = _minify_js('''// Smooth scrolling for navigation links
 document.querySelectorAll('a[href^="#"]').forEach(anchor => {
     anchor.addEventListener('click', function (e) {
         e.preventDefault();
@@ -1653,7 +1796,72 @@ document.querySelectorAll('.feature-card').forEach(card => {
         this.style.background = this.style.background === 'rgb(116, 185, 255)' ? 'white' : '#74b9ff';
         this.style.color = this.style.color === 'white' ? '#333' : 'white';
     });
-});'''
+});''')
+
+
+def _generate_generic_template(overview: str) -> Dict[str, str]:
+    """Generate generic landing page template."""
+    return {
+        "index.html": f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Web Application</title>
+    <link rel="stylesheet" href="styles.css">
+</head>
+<body>
+    <header>
+        <nav>
+            <h1>My App</h1>
+            <ul>
+                <li><a href="#home">Home</a></li>
+                <li><a href="#features">Features</a></li>
+                <li><a href="#about">About</a></li>
+                <li><a href="#contact">Contact</a></li>
+            </ul>
+        </nav>
+    </header>
+    
+    <main>
+        <section id="home" class="hero">
+            <div class="hero-content">
+                <h2>Welcome to Our Application</h2>
+                <p>{overview}</p>
+                <button class="cta-button">Get Started</button>
+            </div>
+        </section>
+        
+        <section id="features" class="features">
+            <h2>Features</h2>
+            <div class="feature-grid">
+                <div class="feature-card">
+                    <h3>Feature 1</h3>
+                    <p>Description of feature 1</p>
+                </div>
+                <div class="feature-card">
+                    <h3>Feature 2</h3>
+                    <p>Description of feature 2</p>
+                </div>
+                <div class="feature-card">
+                    <h3>Feature 3</h3>
+                    <p>Description of feature 3</p>
+                </div>
+            </div>
+        </section>
+    </main>
+    
+    <footer>
+        <p>&copy; 2025 Web Application. All rights reserved.</p>
+    </footer>
+    
+    <script src="script.js"></script>
+</body>
+</html>''',
+
+        "styles.css": _GENERIC_CSS,
+
+        "script.js": _GENERIC_JS
     }
 
 
@@ -1671,10 +1879,7 @@ def _generate_quiz_template() -> Dict[str, str]:
     return _generate_generic_template("An interactive quiz application")
 
 
-def _generate_react_app(project_id: str, overview: str = "", architecture_data: Dict[str, Any] = None) -> Dict[str, str]:
-    """Generate React calculator application."""
-    return {
-        "package.json": '''{
+_REACT_PACKAGE_JSON = '''{
   "name": "calculator-app",
   "version": "1.0.0",
   "private": true,
@@ -1689,9 +1894,9 @@ def _generate_react_app(project_id: str, overview: str = "", architecture_data:
     "test": "react-scripts test",
     "eject": "react-scripts eject"
   }
-}''',
+}'''
 
-        "src/App.js": '''import React, { useState } from 'react';
+_REACT_APP_JS = '''import React, { useState } from 'react';
 import './App.css';
 
 function App() {
@@ -1761,9 +1966,9 @@ function App() {
   );
 }
 
-export default App;''',
+export default App;'''
 
-        "README.md": '''# React Calculator App
+_REACT_README_MD = '''# React Calculator App
 
 A calculator application built with React.js.
 
@@ -1776,84 +1981,142 @@ A calculator application built with React.js.
 - Modern React component structure
 - Responsive design
 '''
-    }
+
+# The React scaffold is rarely generated, so it is kept zlib-compressed and
+# only expanded (once) the first time a React project is requested
+_REACT_APP_BLOBS: Mapping[str, bytes] = MappingProxyType({
+    "package.json": zlib.compress(_REACT_PACKAGE_JSON.encode('utf-8')),
+    "src/App.js": zlib.compress(_REACT_APP_JS.encode('utf-8')),
+    "README.md": zlib.compress(_REACT_README_MD.encode('utf-8'))
+})
+del _REACT_PACKAGE_JSON, _REACT_APP_JS, _REACT_README_MD
+
+
+@lru_cache(maxsize=1)
+def _react_app_files() -> Mapping[str, str]:
+    """Decompress the React scaffold on first use and share it read-only."""
+    return MappingProxyType({
+        filename: zlib.decompress(blob).decode('utf-8')
+        for filename, blob in _REACT_APP_BLOBS.items()
+    })
+
+
+def _generate_react_app(project_id: str, overview: str = "", architecture_data: Dict[str, Any] = None) -> Dict[str, str]:
+    """Generate React calculator application."""
+    # Callers add files (e.g. the project README), so hand out a fresh dict
+    return dict(_react_app_files())
+
+
+# Delimiters checked for balance by _test_source_files (all single-byte in UTF-8)
+_DELIMITERS = "<>{}()"
+
+# Either function syntax counts; one search finds whichever appears first
+_JS_FUNCTION_MARKER = re.compile(r"function|=>")
+
+
+def _delimiter_counts(content: str) -> Dict[str, int]:
+    """Count every balance-checked delimiter in a single pass over the file."""
+    if np is None:
+        return {char: content.count(char) for char in _DELIMITERS}
+    # 'replace' keeps lone surrogates from LLM output from raising; delimiters are unaffected
+    buffer = np.frombuffer(content.encode("utf-8", "replace"), dtype=np.uint8)
+    histogram = np.bincount(buffer, minlength=256)
+    return {char: int(histogram[ord(char)]) for char in _DELIMITERS}
+
+
+def _html_checks(content: str) -> List[Tuple[str, int]]:
+    """Return (issue, penalty) pairs for an HTML file."""
+    issues = []
+    counts = _delimiter_counts(content)
+    if '<!DOCTYPE html>' not in content:
+        issues.append(("Missing DOCTYPE declaration", 10))
+    if '<title>' not in content:
+        issues.append(("Missing title tag", 5))
+    if counts['<'] != counts['>']:
+        issues.append(("Unmatched HTML tags", 15))
+    return issues
+
+
+def _css_checks(content: str) -> List[Tuple[str, int]]:
+    """Return (issue, penalty) pairs for a CSS file."""
+    issues = []
+    counts = _delimiter_counts(content)
+    if counts['{'] != counts['}']:
+        issues.append(("Unmatched CSS braces", 15))
+    if len(content.strip()) < 50:
+        issues.append(("CSS file seems too simple", 5))
+    return issues
+
+
+def _js_checks(content: str) -> List[Tuple[str, int]]:
+    """Return (issue, penalty) pairs for a JavaScript file."""
+    issues = []
+    counts = _delimiter_counts(content)
+    if counts['('] != counts[')']:
+        issues.append(("Unmatched parentheses", 15))
+    if counts['{'] != counts['}']:
+        issues.append(("Unmatched braces", 15))
+    if not _JS_FUNCTION_MARKER.search(content):
+        issues.append(("No functions found", 10))
+    return issues
+
+
+# File-type specific checks keyed by extension
+_FILE_CHECKS = {
+    '.html': _html_checks,
+    '.css': _css_checks,
+    '.js': _js_checks
+}
 
 
 def _test_source_files(source_files: Dict[str, str], tech_used: str) -> Dict[str, Any]:
     """Test the generated source files for quality and correctness."""
-    results = {
-        "files_tested": list(source_files.keys()),
-        "test_results": {},
-        "issues_found": [],
-        "quality_score": 0,
-        "recommendations": []
-    }
-    
+    test_results = {}
+    issues_found = []
     total_score = 0
-    file_count = 0
     
     for filename, content in source_files.items():
         file_score = 100
         file_issues = []
         
-        # Basic tests for all files
         if not content.strip():
+            # Nothing else is worth checking in an empty file
             file_issues.append("File is empty")
             file_score -= 50
-            
-        # HTML-specific tests
-        if filename.endswith('.html'):
-            if '<!DOCTYPE html>' not in content:
-                file_issues.append("Missing DOCTYPE declaration")
-                file_score -= 10
-            if '<title>' not in content:
-                file_issues.append("Missing title tag")
-                file_score -= 5
-            if content.count('<') != content.count('>'):
-                file_issues.append("Unmatched HTML tags")
-                file_score -= 15
-                
-        # CSS-specific tests
-        elif filename.endswith('.css'):
-            if content.count('{') != content.count('}'):
-                file_issues.append("Unmatched CSS braces")
-                file_score -= 15
-            if len(content.strip()) < 50:
-                file_issues.append("CSS file seems too simple")
-                file_score -= 5
-                
-        # JavaScript-specific tests  
-        elif filename.endswith('.js'):
-            if content.count('(') != content.count(')'):
-                file_issues.append("Unmatched parentheses")
-                file_score -= 15
-            if content.count('{') != content.count('}'):
-                file_issues.append("Unmatched braces")
-                file_score -= 15
-            if 'function' not in content and '=>' not in content:
-                file_issues.append("No functions found")
-                file_score -= 10
+        else:
+            checks = _FILE_CHECKS.get(os.path.splitext(filename)[1])
+            if checks:
+                for issue, penalty in checks(content):
+                    file_issues.append(issue)
+                    file_score -= penalty
         
         file_score = max(0, file_score)
         total_score += file_score
-        file_count += 1
         
-        results["test_results"][filename] = {
+        test_results[filename] = {
             "score": file_score,
             "issues": file_issues,
             "status": "pass" if file_score > 80 else "warning" if file_score > 60 else "fail"
         }
         
-        results["issues_found"].extend([f"{filename}: {issue}" for issue in file_issues])
+        issues_found.extend([f"{filename}: {issue}" for issue in file_issues])
+    
+    results = {
+        "files_tested": list(source_files.keys()),
+        "test_results": test_results,
+        "issues_found": issues_found,
+        "quality_score": 0,
+        "recommendations": []
+    }
     
     # Calculate overall quality score
-    if file_count > 0:
-        results["quality_score"] = round(total_score / file_count, 1)
+    if source_files:
+        results["quality_score"] = round(total_score / len(source_files), 1)
         
         # Generate recommendations
         if results["quality_score"] < 70:
             results["recommendations"].append("Code quality needs improvement")
-        if len(results["issues_found"]) > 3:
+        if len(issues_found) > 3:
             results["recommendations"].append("Multiple issues found - consider review")
         if results["quality_score"] > 85:
             results["recommendations"].append("Good code quality - ready for deployment")
@@ -1861,18 +2124,97 @@ def _test_source_files(source_files: Dict[str, str], tech_used: str) -> Dict[str
     return results
 
 
+# Root of all generated project output
+_OUT_ROOT = Path(__file__).resolve().parent.parent.parent / "out"
+
+
+@lru_cache(maxsize=1024)
+def _ensure_dir(path: Path) -> Path:
+    """Create an output directory once per process instead of on every save."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _write_file(path: Path, content: Union[str, bytes]) -> None:
+    """Write a project file, recreating its directory if it was removed after being cached."""
+    def write() -> None:
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding='utf-8')
+
+    try:
+        write()
+    except FileNotFoundError:
+        _ensure_dir.cache_clear()
+        _ensure_dir(path.parent)
+        write()
+
+
+def _artifact_json(data: Dict[str, Any]) -> bytes:
+    """Serialise an artifact as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Maps path separators and dots to underscores when naming per-file artifacts
+_SAFE_FILENAME_TABLE = str.maketrans("/.", "__")
+
+# Artifact writes are disk bound, so a batch of them is spread over a small
+# shared pool instead of running back to back on the calling thread.
+_ARTIFACT_WRITER = ThreadPoolExecutor(max_workers=8, thread_name_prefix="artifact-writer")
+
+
+# Digest of the last content written for each source file, per project, so
+# unchanged files are not rewritten on iterative runs. Persisted next to the
+# project output so the benefit survives restarts.
+_SOURCE_DIGESTS_FILE = ".source_digests.json"
+_source_digests: Dict[str, Dict[str, str]] = {}
+_source_digests_lock = threading.Lock()
+
+
+def _project_source_digests(project_id: str) -> Dict[str, str]:
+    """Return the known source file digests for a project, loading them on first use."""
+    with _source_digests_lock:
+        digests = _source_digests.get(project_id)
+        if digests is None:
+            try:
+                digests_path = _OUT_ROOT / f"project_{project_id}" / _SOURCE_DIGESTS_FILE
+                digests = json.loads(digests_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                digests = {}
+            _source_digests[project_id] = digests
+        return digests
+
+
+def _save_source_files(project_id: str, source_files: Dict[str, str]) -> None:
+    """Save a batch of source files concurrently and wait until all are on disk."""
+    futures = [
+        _ARTIFACT_WRITER.submit(_save_source_file, project_id, filename, content)
+        for filename, content in source_files.items()
+    ]
+    for future in futures:
+        future.result()
+
+    digests = _project_source_digests(project_id)
+    with _source_digests_lock:
+        snapshot = json.dumps(digests)
+    try:
+        _write_file(_ensure_dir(_OUT_ROOT / f"project_{project_id}") / _SOURCE_DIGESTS_FILE, snapshot)
+    except OSError as e:
+        print(f"Error saving source digests: {e}")
+
+
 def _save_source_file(project_id: str, filename: str, content: str) -> None:
     """Save individual source code file with proper project structure."""
     try:
         # Create project directory with proper structure
-        base_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
-        base_dir.mkdir(parents=True, exist_ok=True)
+        base_dir = _ensure_dir(_OUT_ROOT / f"project_{project_id}")
         
         # Create subdirectories
-        src_dir = base_dir / "src"
-        docs_dir = base_dir / "docs"
-        src_dir.mkdir(exist_ok=True)
-        docs_dir.mkdir(exist_ok=True)
+        src_dir = _ensure_dir(base_dir / "src")
+        docs_dir = _ensure_dir(base_dir / "docs")
         
         # Determine where to save the file based on its type
         if filename.endswith('.md'):
@@ -1885,9 +2227,17 @@ def _save_source_file(project_id: str, filename: str, content: str) -> None:
             # Source code goes in src folder
             file_path = src_dir / filename
         
+        # Skip files whose content is unchanged since the last write
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+        digests = _project_source_digests(project_id)
+        if digests.get(filename) == digest and file_path.exists():
+            print(f"⏭️ Source file unchanged: {file_path}")
+            return
+        
         # Save the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_file(file_path, content)
+        with _source_digests_lock:
+            digests[filename] = digest
         
         print(f"✅ Saved source file: {file_path}")
         
@@ -1901,8 +2251,8 @@ def _save_source_file(project_id: str, filename: str, content: str) -> None:
             "created_at": datetime.now().isoformat(),
             "created_by": "developer_agent"
         }
-        safe_filename = filename.replace('/', '_').replace('.', '_')
-        _save_artifact(project_id, f"source_code_metadata_{safe_filename}", file_result)
+        safe_filename = filename.translate(_SAFE_FILENAME_TABLE)
+        _save_artifact(project_id, f"source_code_metadata_{safe_filename}", file_result, emit_markdown=False)
         
     except Exception as e:
         print(f"Error saving source file {filename}: {e}")
@@ -1915,27 +2265,34 @@ def _save_source_file(project_id: str, filename: str, content: str) -> None:
             "created_by": "developer_agent",
             "error": str(e)
         }
-        safe_filename = filename.replace('/', '_').replace('.', '_')
+        safe_filename = filename.translate(_SAFE_FILENAME_TABLE)
         _save_artifact(project_id, f"source_code_{safe_filename}", file_result)
 
 
-def _save_artifact(project_id: str, artifact_type: str, data: Dict[str, Any]) -> None:
-    """Save artifact data to project folder."""
+def _save_artifact(project_id: str, artifact_type: str, data: Dict[str, Any], emit_markdown: bool = True) -> None:
+    """
+    Save artifact data to project folder.
+    
+    Args:
+        project_id: Unique identifier for the project
+        artifact_type: Artifact name used for the output file names
+        data: Artifact content
+        emit_markdown: Also write a human-readable markdown copy. Bookkeeping
+            artifacts that nobody reads skip it to halve their writes.
+    """
     try:
         # Create project directory
-        base_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
-        base_dir.mkdir(parents=True, exist_ok=True)
+        base_dir = _ensure_dir(_OUT_ROOT / f"project_{project_id}")
         
         # Save as JSON
         file_path = base_dir / f"{artifact_type}_{data.get('created_by', 'agent')}.json"
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_file(file_path, _artifact_json(data))
             
         # Also save as markdown for readability
-        md_content = _convert_to_markdown(artifact_type, data)
-        md_path = base_dir / f"{artifact_type}_{data.get('created_by', 'agent')}.md"
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        if emit_markdown:
+            md_content = _convert_to_markdown(artifact_type, data)
+            md_path = base_dir / f"{artifact_type}_{data.get('created_by', 'agent')}.md"
+            _write_file(md_path, md_content)
             
     except Exception as e:
         print(f"Error saving artifact: {e}")
@@ -1943,35 +2300,35 @@ def _save_artifact(project_id: str, artifact_type: str, data: Dict[str, Any]) ->
 
 def _convert_to_markdown(artifact_type: str, data: Dict[str, Any]) -> str:
     """Convert artifact data to markdown format."""
-    md_content = f"# {artifact_type.replace('_', ' ').title()}\n\n"
+    parts = [f"# {artifact_type.replace('_', ' ').title()}\n\n"]
     
     # Add metadata
     if "created_at" in data:
-        md_content += f"**Created:** {data['created_at']}\n"
+        parts.append(f"**Created:** {data['created_at']}\n")
     if "created_by" in data:
-        md_content += f"**Created by:** {data['created_by']}\n"
+        parts.append(f"**Created by:** {data['created_by']}\n")
     if "project_id" in data:
-        md_content += f"**Project ID:** {data['project_id']}\n\n"
+        parts.append(f"**Project ID:** {data['project_id']}\n\n")
     
     # Convert main content
     for key, value in data.items():
         if key in ["created_at", "created_by", "project_id"]:
             continue
             
-        md_content += f"## {key.replace('_', ' ').title()}\n\n"
+        parts.append(f"## {key.replace('_', ' ').title()}\n\n")
         
         if isinstance(value, list):
             for item in value:
                 if isinstance(item, dict):
-                    md_content += f"- **{item.get('name', 'Item')}**: {item.get('description', str(item))}\n"
+                    parts.append(f"- **{item.get('name', 'Item')}**: {item.get('description', str(item))}\n")
                 else:
-                    md_content += f"- {item}\n"
+                    parts.append(f"- {item}\n")
         elif isinstance(value, dict):
             for subkey, subvalue in value.items():
-                md_content += f"- **{subkey}**: {subvalue}\n"
+                parts.append(f"- **{subkey}**: {subvalue}\n")
         else:
-            md_content += f"{value}\n"
+            parts.append(f"{value}\n")
         
-        md_content += "\n"
+        parts.append("\n")
     
-    return md_content
+    return "".join(parts)
@@ -13,12 +13,15 @@ Key improvements:
 """
 
 import asyncio
+import heapq
 import json
 import uuid
 import os
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Sequence, AsyncIterator
+from typing import Dict, List, Optional, Any, Sequence, AsyncIterator, Tuple, Collection
 import logging
 
 from mcp.server import Server
@@ -28,6 +31,18 @@ from mcp.server.stdio import stdio_server
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; serialisation falls back to the stdlib json module
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop (installed with uvicorn[standard]) is optional; asyncio's default loop is used otherwise
+    uvloop = None
+
 from .workflow import run_software_development_workflow
 
 # Configure logging
@@ -40,44 +55,187 @@ load_dotenv()
 # Initialize the enhanced MCP server
 app = Server("agentic-ecosystem")
 
+# Repository-relative locations, resolved once at import time
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+_DATA_DIR = _REPO_ROOT / "data"
+_OUT_ROOT = _REPO_ROOT / "out"
+
+
+def _project_dir(project_id: str) -> Path:
+    """Return the output directory for a project's generated artifacts."""
+    return _OUT_ROOT / f"project_{project_id}"
+
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialise data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps(data: Any) -> str:
+    """Serialise data as an indented JSON string for MCP text responses."""
+    return _dumps_bytes(data).decode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON from raw file bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file; blocking, so async callers offload it to a thread."""
+    return _loads(path.read_bytes())
+
+
 # Enhanced project tracking with persistence
 class ProjectManager:
     """Enhanced project management with persistence and state tracking."""
     
+    # Upper bound on parsed artifact files kept in memory
+    ARTIFACT_CACHE_SIZE = 256
+    # Window in seconds over which bursts of project updates share one disk write
+    SAVE_DEBOUNCE_SECONDS = 0.5
+    
     def __init__(self):
-        self.data_dir = Path(__file__).parent.parent.parent / "data"
+        self.data_dir = _DATA_DIR
         self.data_dir.mkdir(exist_ok=True)
         self.projects_file = self.data_dir / "projects.json"
         self.active_projects: Dict[str, Dict[str, Any]] = {}
+        # Parsed artifact JSON keyed by path, tagged with the file's mtime_ns
+        self._artifact_cache: OrderedDict[Path, Tuple[int, Any]] = OrderedDict()
+        self._artifact_cache_lock = threading.Lock()
+        # list_resources() result, rebuilt only when projects or their output dirs change
+        self._resources_cache: Optional[List[types.Resource]] = None
+        self._resources_fingerprint: Optional[Tuple[Optional[int], ...]] = None
+        self._projects_dirty = True
+        # Pending debounced save, if one has been scheduled on the event loop
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_task: Optional[asyncio.Future] = None
+        # Serialises writers on projects.json.tmp; generations stop an older
+        # snapshot from landing after a newer one
+        self._write_lock = threading.Lock()
+        self._save_generation = 0
+        self._written_generation = 0
+        # Secondary indices from status/domain to project ids for filtered listings
+        self._by_status: Dict[Any, set] = defaultdict(set)
+        self._by_domain: Dict[Any, set] = defaultdict(set)
         self._load_projects()
     
     def _load_projects(self):
         """Load projects from persistent storage."""
         if self.projects_file.exists():
             try:
-                with open(self.projects_file, 'r', encoding='utf-8') as f:
-                    saved_projects = json.load(f)
+                saved_projects = _loads(self.projects_file.read_bytes())
                 self.active_projects.update(saved_projects)
+                for project in saved_projects.values():
+                    self._index_project(project)
                 logger.info(f"Loaded {len(saved_projects)} projects from storage")
             except Exception as e:
                 logger.error(f"Failed to load projects: {e}")
     
+    def _index_project(self, project: Dict[str, Any]):
+        """Add a project to the status and domain indices."""
+        self._by_status[project.get("status")].add(project["id"])
+        self._by_domain[project.get("domain")].add(project["id"])
+    
+    def _unindex_project(self, project: Dict[str, Any]):
+        """Remove a project from the status and domain indices."""
+        self._by_status[project.get("status")].discard(project["id"])
+        self._by_domain[project.get("domain")].discard(project["id"])
+    
     def _save_projects(self):
         """Save projects to persistent storage."""
-        try:
-            with open(self.projects_file, 'w', encoding='utf-8') as f:
-                json.dump(self.active_projects, f, indent=2, default=str)
-        except Exception as e:
-            logger.error(f"Failed to save projects: {e}")
+        self._write_projects(*self._snapshot_projects())
     
-    def create_project(self, specification: str, title: str = None, domain: str = None) -> str:
-        """Create a new project with enhanced tracking."""
-        project_id = str(uuid.uuid4())
+    def _snapshot_projects(self) -> Tuple[int, bytes]:
+        """Serialise the current projects, tagged with a new save generation."""
+        self._save_generation += 1
+        return self._save_generation, _dumps_bytes(self.active_projects)
+    
+    def _write_projects(self, generation: int, payload: bytes):
+        """Write serialised projects to persistent storage.
+        
+        The payload goes to a temporary file that then replaces projects.json,
+        so a crash mid-write never leaves a truncated file behind. Writes are
+        serialised, and a snapshot older than the last one written is dropped.
+        """
+        tmp_file = self.projects_file.with_suffix('.json.tmp')
+        with self._write_lock:
+            if generation < self._written_generation:
+                return
+            try:
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, self.projects_file)
+                self._written_generation = generation
+            except Exception as e:
+                logger.error(f"Failed to save projects: {e}")
+    
+    def _schedule_save(self):
+        """Mark projects as changed and persist them, coalescing bursts of updates.
+        
+        Inside a running event loop the write is deferred by SAVE_DEBOUNCE_SECONDS
+        so several updates share one write; without a loop it happens immediately.
+        """
+        self._projects_dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_projects()
+            return
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self.SAVE_DEBOUNCE_SECONDS, self._flush_pending_save)
+    
+    def _flush_pending_save(self):
+        """Run the debounced save: snapshot on the loop, write in a worker thread."""
+        loop = asyncio.get_running_loop()
+        if self._save_task is not None and not self._save_task.done():
+            # The previous write is still running; wait another window rather than overlap it
+            self._save_handle = loop.call_later(self.SAVE_DEBOUNCE_SECONDS, self._flush_pending_save)
+            return
+        self._save_handle = None
+        generation, payload = self._snapshot_projects()
+        self._save_task = asyncio.ensure_future(asyncio.to_thread(self._write_projects, generation, payload))
+    
+    async def flush_async(self):
+        """Write any pending debounced save without blocking the event loop."""
+        # Let an in-flight write land first so it can't overwrite the newer snapshot
+        if self._save_task is not None:
+            await self._save_task
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+            await asyncio.to_thread(self._write_projects, *self._snapshot_projects())
+    
+    def load_json_cached(self, path: Path) -> Any:
+        """Load a JSON artifact, reusing the parsed result while the file is unchanged.
         
-        project_data = {
+        Blocking, so async callers should run it via asyncio.to_thread.
+        """
+        mtime_ns = path.stat().st_mtime_ns
+        with self._artifact_cache_lock:
+            hit = self._artifact_cache.get(path)
+            if hit is not None and hit[0] == mtime_ns:
+                self._artifact_cache.move_to_end(path)
+                return hit[1]
+        
+        data = _read_json(path)
+        with self._artifact_cache_lock:
+            self._artifact_cache[path] = (mtime_ns, data)
+            self._artifact_cache.move_to_end(path)
+            if len(self._artifact_cache) > self.ARTIFACT_CACHE_SIZE:
+                self._artifact_cache.popitem(last=False)
+        return data
+    
+    @staticmethod
+    def _build_project_dict(project_id: str, title: str, domain: str, specification: str) -> Dict[str, Any]:
+        """Build the initial record for a newly created project."""
+        return {
             "id": project_id,
-            "title": title or "Untitled Project",
-            "domain": domain or "General",
+            "title": title,
+            "domain": domain,
             "specification": specification,
             "status": "initiated",
             "created_at": datetime.now().isoformat(),
@@ -86,49 +244,123 @@ class ProjectManager:
             "phases": ["business_analysis", "architecture", "implementation", "testing"],
             "completed_phases": []
         }
-        
+    
+    def _add_project(self, project_data: Dict[str, Any]) -> str:
+        """Register a new project, index it and schedule it for persistence."""
+        project_id = project_data["id"]
         self.active_projects[project_id] = project_data
-        self._save_projects()
+        self._index_project(project_data)
+        self._schedule_save()
         
-        logger.info(f"Created project {project_id}: {title}")
+        logger.info(f"Created project {project_id}: {project_data['title']}")
         return project_id
     
-    def update_project(self, project_id: str, updates: Dict[str, Any]):
-        """Update project with new data."""
-        if project_id in self.active_projects:
-            self.active_projects[project_id].update(updates)
-            self.active_projects[project_id]["updated_at"] = datetime.now().isoformat()
-            self._save_projects()
+    def create_project(self, specification: str, title: str = None, domain: str = None) -> str:
+        """Create a new project with enhanced tracking."""
+        return self._add_project(self._build_project_dict(
+            str(uuid.uuid4()), title or "Untitled Project", domain or "General", specification
+        ))
+    
+    def update_project(self, project_id: str, updates: Dict[str, Any], now: Optional[str] = None):
+        """Update project with new data.
+        
+        ``now`` lets callers that already formatted a timestamp reuse it for updated_at.
+        """
+        project = self.active_projects.get(project_id)
+        if project is None:
+            return
+        self._unindex_project(project)
+        project.update(updates)
+        project["updated_at"] = now or datetime.now().isoformat()
+        self._index_project(project)
+        self._schedule_save()
+    
+    def mark_phase_completed(self, project_id: str, phase_name: str, next_phase: str):
+        """Record a finished workflow phase and advance the project's current phase."""
+        project = self.active_projects.get(project_id)
+        if project is None:
+            return
+        project.setdefault("completed_phases", []).append(phase_name)
+        project["current_phase"] = next_phase
+        project["updated_at"] = datetime.now().isoformat()
+        self._schedule_save()
     
     def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
         """Get project data."""
         return self.active_projects.get(project_id)
     
-    def list_projects(self) -> List[Dict[str, Any]]:
-        """List all projects."""
-        return list(self.active_projects.values())
+    def list_projects(self, status: str = None, domain: str = None) -> Collection[Dict[str, Any]]:
+        """List all projects, optionally only those with the given status and/or domain.
+        
+        Without filters this is a live view over the stored projects; copy it with
+        list() before awaiting or mutating projects while iterating.
+        """
+        if status is None and domain is None:
+            return self.active_projects.values()
+        
+        if status is not None and domain is not None:
+            ids = self._by_status.get(status, set()) & self._by_domain.get(domain, set())
+        elif status is not None:
+            ids = self._by_status.get(status, ())
+        else:
+            ids = self._by_domain.get(domain, ())
+        return [self.active_projects[project_id] for project_id in ids]
     
-    # Async methods for web server compatibility
-    async def create_project(self, project_id: str, title: str, specification: str, domain: str = "web-application") -> str:
-        """Async version of create_project for web server."""
-        project_data = {
-            "id": project_id,
-            "title": title,
-            "domain": domain,
-            "specification": specification,
-            "status": "initiated",
-            "created_at": datetime.now().isoformat(),
-            "current_phase": "initiating",
-            "progress": 0,
-            "phases": ["business_analysis", "architecture", "implementation", "testing"],
-            "completed_phases": []
-        }
+    def list_resources(self) -> List[types.Resource]:
+        """List project and artifact resources, reusing the last listing while it is current.
         
-        self.active_projects[project_id] = project_data
-        self._save_projects()
+        The listing is rebuilt when a project changes (see _schedule_save) or when a
+        project's output directory gains or loses files.
+        """
+        projects = list(self.list_projects())
         
-        logger.info(f"Created project {project_id}: {title}")
-        return project_id
+        # Adding or removing an artifact bumps its project directory's mtime, so one
+        # stat per project tells us whether the cached listing is still accurate
+        project_dirs = [_project_dir(p["id"]) for p in projects]
+        fingerprint = tuple(_dir_mtime_ns(d) for d in project_dirs)
+        if (
+            not self._projects_dirty
+            and self._resources_cache is not None
+            and fingerprint == self._resources_fingerprint
+        ):
+            return list(self._resources_cache)
+        
+        resources = []
+        
+        # Add project resources
+        for project, project_dir, mtime_ns in zip(projects, project_dirs, fingerprint):
+            project_id = project["id"]
+            resources.append(
+                types.Resource(
+                    uri=f"project://{project_id}",
+                    name=f"Project: {project['title']}",
+                    description=f"Project data and artifacts for {project['title']}",
+                    mimeType="application/json"
+                )
+            )
+            
+            # Add artifact resources if they exist
+            if mtime_ns is not None:
+                for artifact_file in project_dir.glob("*.json"):
+                    if artifact_file.name != "project_summary.json":
+                        resources.append(
+                            types.Resource(
+                                uri=f"artifact://{project_id}/{artifact_file.stem}",
+                                name=f"{project['title']} - {artifact_file.stem.title()}",
+                                description=f"Generated artifact: {artifact_file.stem}",
+                                mimeType="application/json"
+                            )
+                        )
+        
+        self._resources_cache = resources
+        self._resources_fingerprint = fingerprint
+        self._projects_dirty = False
+        return list(resources)
+    
+    # Async methods for web server compatibility
+    async def create_project_async(self, project_id: str, title: str, specification: str, domain: str = "web-application") -> str:
+        """Async version of create_project for web server, using a caller-supplied id."""
+        return self._add_project(self._build_project_dict(project_id, title, domain, specification))
     
     async def get_project_status(self, project_id: str) -> Dict[str, Any]:
         """Get project status asynchronously."""
@@ -139,22 +371,25 @@ class ProjectManager:
     
     async def list_projects_async(self) -> List[Dict[str, Any]]:
         """Async version of list_projects."""
-        return self.list_projects()
+        return list(self.list_projects())
     
     async def get_project_artifacts(self, project_id: str) -> Dict[str, Any]:
         """Get artifacts for a project."""
-        project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
+        project_dir = _project_dir(project_id)
         artifacts = {}
         
         if project_dir.exists():
-            for artifact_file in project_dir.glob("*.json"):
-                if artifact_file.name != "project_summary.json":
-                    artifact_name = artifact_file.stem
-                    try:
-                        with open(artifact_file, 'r', encoding='utf-8') as f:
-                            artifacts[artifact_name] = json.load(f)
-                    except Exception as e:
-                        logger.error(f"Failed to load artifact {artifact_name}: {e}")
+            entries = await asyncio.to_thread(_json_entries, project_dir)
+            artifact_files = [Path(e.path) for e in entries if e.name != "project_summary.json"]
+            loaded = await asyncio.gather(
+                *(asyncio.to_thread(self.load_json_cached, p) for p in artifact_files),
+                return_exceptions=True
+            )
+            for artifact_file, data in zip(artifact_files, loaded):
+                if isinstance(data, Exception):
+                    logger.error(f"Failed to load artifact {artifact_file.stem}: {data}")
+                else:
+                    artifacts[artifact_file.stem] = data
         
         return {
             "project_id": project_id,
@@ -163,75 +398,69 @@ class ProjectManager:
     
     async def update_project_status(self, project_id: str, status: str, progress: int = None):
         """Update project status and progress."""
-        if project_id in self.active_projects:
-            self.active_projects[project_id]["status"] = status
-            if progress is not None:
-                self.active_projects[project_id]["progress"] = progress
-            self.active_projects[project_id]["updated_at"] = datetime.now().isoformat()
-            self._save_projects()
+        project = self.active_projects.get(project_id)
+        if project is None:
+            return
+        self._unindex_project(project)
+        project["status"] = status
+        self._index_project(project)
+        if progress is not None:
+            project["progress"] = progress
+        project["updated_at"] = datetime.now().isoformat()
+        self._schedule_save()
 
 # Initialize project manager
 project_manager = ProjectManager()
 
 
+# Resource URI schemes served by read_resource
+_PROJECT_URI_PREFIX = "project://"
+_ARTIFACT_URI_PREFIX = "artifact://"
+
+
+def _json_entries(directory: Path) -> List[os.DirEntry]:
+    """List the *.json files in a directory in one scandir pass."""
+    with os.scandir(directory) as it:
+        return [e for e in it if e.name.endswith(".json") and e.is_file()]
+
+
+def _dir_mtime_ns(path: Path) -> Optional[int]:
+    """Return a directory's mtime in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 @app.list_resources()
 async def list_resources() -> List[types.Resource]:
     """List available resources (project data, artifacts, etc.)."""
-    resources = []
-    
-    # Add project resources
-    for project in project_manager.list_projects():
-        project_id = project["id"]
-        resources.append(
-            types.Resource(
-                uri=f"project://{project_id}",
-                name=f"Project: {project['title']}",
-                description=f"Project data and artifacts for {project['title']}",
-                mimeType="application/json"
-            )
-        )
-        
-        # Add artifact resources if they exist
-        project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
-        if project_dir.exists():
-            for artifact_file in project_dir.glob("*.json"):
-                if artifact_file.name != "project_summary.json":
-                    resources.append(
-                        types.Resource(
-                            uri=f"artifact://{project_id}/{artifact_file.stem}",
-                            name=f"{project['title']} - {artifact_file.stem.title()}",
-                            description=f"Generated artifact: {artifact_file.stem}",
-                            mimeType="application/json"
-                        )
-                    )
-    
-    return resources
+    return project_manager.list_resources()
 
 
 @app.read_resource()
 async def read_resource(uri: str) -> str:
     """Read resource content."""
     try:
-        if uri.startswith("project://"):
-            project_id = uri.replace("project://", "")
+        if uri.startswith(_PROJECT_URI_PREFIX):
+            project_id = uri[len(_PROJECT_URI_PREFIX):]
             project = project_manager.get_project(project_id)
             if project:
-                return json.dumps(project, indent=2)
+                return _dumps(project)
             else:
                 raise ValueError(f"Project {project_id} not found")
         
-        elif uri.startswith("artifact://"):
+        elif uri.startswith(_ARTIFACT_URI_PREFIX):
             # Parse artifact URI: artifact://project_id/artifact_name
-            parts = uri.replace("artifact://", "").split("/")
-            if len(parts) != 2:
+            rest = uri[len(_ARTIFACT_URI_PREFIX):]
+            project_id, sep, artifact_name = rest.partition("/")
+            if not sep or "/" in artifact_name:
                 raise ValueError("Invalid artifact URI format")
             
-            project_id, artifact_name = parts
-            artifact_file = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}" / f"{artifact_name}.json"
+            artifact_file = _project_dir(project_id) / f"{artifact_name}.json"
             
             if artifact_file.exists():
-                with open(artifact_file, 'r', encoding='utf-8') as f:
-                    return f.read()
+                return await asyncio.to_thread(artifact_file.read_text, encoding='utf-8')
             else:
                 raise ValueError(f"Artifact {artifact_name} not found for project {project_id}")
         
@@ -243,120 +472,124 @@ async def read_resource(uri: str) -> str:
         raise
 
 
-@app.list_tools()
-async def list_tools() -> List[types.Tool]:
-    """List available tools with enhanced schemas."""
-    return [
-        types.Tool(
-            name="create_project",
-            description="Create a new software development project using LangGraph multi-agent workflow with enhanced tracking",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "specification": {
-                        "type": "string",
-                        "description": "Detailed project specification and requirements",
-                        "minLength": 10
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Project title",
-                        "maxLength": 100
-                    },
-                    "domain": {
-                        "type": "string",
-                        "description": "Project domain (e.g., web, mobile, data, api, ml)",
-                        "enum": ["web", "mobile", "data", "api", "ml", "desktop", "embedded", "general"]
-                    },
-                    "priority": {
-                        "type": "string",
-                        "description": "Project priority level",
-                        "enum": ["low", "medium", "high", "urgent"],
-                        "default": "medium"
-                    }
+# Tool definitions never change at runtime, so build them once at import
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="create_project",
+        description="Create a new software development project using LangGraph multi-agent workflow with enhanced tracking",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "specification": {
+                    "type": "string",
+                    "description": "Detailed project specification and requirements",
+                    "minLength": 10
                 },
-                "required": ["specification"]
-            }
-        ),
-        types.Tool(
-            name="get_project_status",
-            description="Get comprehensive status and progress of a project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "The unique project identifier (UUID format)",
-                        "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-                    },
-                    "include_artifacts": {
-                        "type": "boolean",
-                        "description": "Whether to include artifact summaries in the response",
-                        "default": False
-                    }
+                "title": {
+                    "type": "string",
+                    "description": "Project title",
+                    "maxLength": 100
                 },
-                "required": ["project_id"]
-            }
-        ),
-        types.Tool(
-            name="list_projects",
-            description="List all projects with filtering and sorting options",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status": {
-                        "type": "string",
-                        "description": "Filter by project status",
-                        "enum": ["initiated", "in_progress", "completed", "failed"]
-                    },
-                    "domain": {
-                        "type": "string",
-                        "description": "Filter by project domain"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of projects to return",
-                        "minimum": 1,
-                        "maximum": 100,
-                        "default": 20
-                    }
+                "domain": {
+                    "type": "string",
+                    "description": "Project domain (e.g., web, mobile, data, api, ml)",
+                    "enum": ["web", "mobile", "data", "api", "ml", "desktop", "embedded", "general"]
+                },
+                "priority": {
+                    "type": "string",
+                    "description": "Project priority level",
+                    "enum": ["low", "medium", "high", "urgent"],
+                    "default": "medium"
                 }
-            }
-        ),
-        types.Tool(
-            name="get_project_artifacts",
-            description="Get detailed artifacts generated for a project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "The unique project identifier"
-                    },
-                    "artifact_type": {
-                        "type": "string",
-                        "description": "Specific artifact type to retrieve",
-                        "enum": ["business_analysis", "system_architecture", "implementation_plan", "test_strategy", "all"]
-                    }
+            },
+            "required": ["specification"]
+        }
+    ),
+    types.Tool(
+        name="get_project_status",
+        description="Get comprehensive status and progress of a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The unique project identifier (UUID format)",
+                    "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
                 },
-                "required": ["project_id"]
-            }
-        ),
-        types.Tool(
-            name="monitor_project_progress",
-            description="Get real-time progress updates for an active project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "The unique project identifier"
-                    }
+                "include_artifacts": {
+                    "type": "boolean",
+                    "description": "Whether to include artifact summaries in the response",
+                    "default": False
+                }
+            },
+            "required": ["project_id"]
+        }
+    ),
+    types.Tool(
+        name="list_projects",
+        description="List all projects with filtering and sorting options",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status": {
+                    "type": "string",
+                    "description": "Filter by project status",
+                    "enum": ["initiated", "in_progress", "completed", "failed"]
+                },
+                "domain": {
+                    "type": "string",
+                    "description": "Filter by project domain"
                 },
-                "required": ["project_id"]
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of projects to return",
+                    "minimum": 1,
+                    "maximum": 100,
+                    "default": 20
+                }
             }
-        )
-    ]
+        }
+    ),
+    types.Tool(
+        name="get_project_artifacts",
+        description="Get detailed artifacts generated for a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The unique project identifier"
+                },
+                "artifact_type": {
+                    "type": "string",
+                    "description": "Specific artifact type to retrieve",
+                    "enum": ["business_analysis", "system_architecture", "implementation_plan", "test_strategy", "all"]
+                }
+            },
+            "required": ["project_id"]
+        }
+    ),
+    types.Tool(
+        name="monitor_project_progress",
+        description="Get real-time progress updates for an active project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The unique project identifier"
+                }
+            },
+            "required": ["project_id"]
+        }
+    )
+]
+
+
+@app.list_tools()
+async def list_tools() -> List[types.Tool]:
+    """List available tools with enhanced schemas."""
+    return list(_TOOLS)
 
 
 @app.call_tool()
@@ -388,7 +621,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[types.Text
         }
         return [types.TextContent(
             type="text",
-            text=json.dumps(error_result, indent=2)
+            text=_dumps(error_result)
         )]
 
 
@@ -398,6 +631,7 @@ async def handle_create_project_enhanced(arguments: Dict[str, Any]) -> Sequence[
     title = arguments.get("title", "Untitled Project")
     domain = arguments.get("domain", "general")
     priority = arguments.get("priority", "medium")
+    now_iso = datetime.now().isoformat()
     
     # Create project with enhanced tracking
     project_id = project_manager.create_project(specification, title, domain)
@@ -407,7 +641,7 @@ async def handle_create_project_enhanced(arguments: Dict[str, Any]) -> Sequence[
         "priority": priority,
         "estimated_duration": "TBD",
         "complexity": "TBD"
-    })
+    }, now=now_iso)
     
     # Start workflow in background with enhanced monitoring
     asyncio.create_task(run_project_workflow_enhanced(project_id, specification))
@@ -419,13 +653,13 @@ async def handle_create_project_enhanced(arguments: Dict[str, Any]) -> Sequence[
         "priority": priority,
         "status": "initiated",
         "message": f"Project '{title}' created successfully. Enhanced LangGraph workflow starting...",
-        "created_at": datetime.now().isoformat(),
+        "created_at": now_iso,
         "tracking_uri": f"project://{project_id}"
     }
     
     return [types.TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=_dumps(result)
     )]
 
 
@@ -439,30 +673,34 @@ async def handle_get_project_status_enhanced(arguments: Dict[str, Any]) -> Seque
         raise ValueError(f"Project {project_id} not found")
     
     # Enhance with file system data
-    project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
+    project_dir = _project_dir(project_id)
     if project_dir.exists():
+        # Work on a copy so summary fields and artifact listings don't leak
+        # into the stored project (and bypass its status index)
+        project = dict(project)
         summary_file = project_dir / "project_summary.json"
         if summary_file.exists():
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
+            summary_data = await asyncio.to_thread(project_manager.load_json_cached, summary_file)
             project.update(summary_data)
         
         # Add artifact information if requested
         if include_artifacts:
             artifacts = {}
-            for artifact_file in project_dir.glob("*.json"):
-                if artifact_file.name != "project_summary.json":
-                    artifacts[artifact_file.stem] = {
-                        "file": artifact_file.name,
-                        "size": artifact_file.stat().st_size,
-                        "modified": datetime.fromtimestamp(artifact_file.stat().st_mtime).isoformat(),
-                        "uri": f"artifact://{project_id}/{artifact_file.stem}"
+            for entry in _json_entries(project_dir):
+                if entry.name != "project_summary.json":
+                    stem = entry.name[:-len(".json")]
+                    st = entry.stat()
+                    artifacts[stem] = {
+                        "file": entry.name,
+                        "size": st.st_size,
+                        "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
+                        "uri": f"artifact://{project_id}/{stem}"
                     }
             project["artifacts"] = artifacts
     
     return [types.TextContent(
         type="text",
-        text=json.dumps(project, indent=2)
+        text=_dumps(project)
     )]
 
 
@@ -472,20 +710,11 @@ async def handle_list_projects_enhanced(arguments: Dict[str, Any]) -> Sequence[t
     domain_filter = arguments.get("domain")
     limit = arguments.get("limit", 20)
     
-    projects = project_manager.list_projects()
-    
-    # Apply filters
-    if status_filter:
-        projects = [p for p in projects if p.get("status") == status_filter]
+    # Filtered through the status/domain indices; empty filters mean no filter
+    projects = project_manager.list_projects(status=status_filter or None, domain=domain_filter or None)
     
-    if domain_filter:
-        projects = [p for p in projects if p.get("domain") == domain_filter]
-    
-    # Sort by creation date (newest first)
-    projects.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    
-    # Apply limit
-    projects = projects[:limit]
+    # Newest first, limited; nlargest keeps only `limit` entries instead of sorting everything
+    projects = heapq.nlargest(limit, projects, key=lambda x: x.get("created_at", ""))
     
     result = {
         "projects": projects,
@@ -500,16 +729,22 @@ async def handle_list_projects_enhanced(arguments: Dict[str, Any]) -> Sequence[t
     
     return [types.TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=_dumps(result)
     )]
 
 
 async def handle_get_project_artifacts_enhanced(arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
-    """Enhanced artifact retrieval."""
+    """Enhanced artifact retrieval.
+    
+    A specific artifact comes back as a single JSON document. For "all", the
+    first content item is a header listing the artifact names and each artifact
+    follows as its own {"artifact": name, "data": ...} item, so no single
+    serialised payload has to hold every artifact at once.
+    """
     project_id = arguments["project_id"]
     artifact_type = arguments.get("artifact_type", "all")
     
-    project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
+    project_dir = _project_dir(project_id)
     if not project_dir.exists():
         raise ValueError(f"No artifacts found for project {project_id}")
     
@@ -517,16 +752,27 @@ async def handle_get_project_artifacts_enhanced(arguments: Dict[str, Any]) -> Se
     
     if artifact_type == "all":
         # Get all artifacts
-        for artifact_file in project_dir.glob("*.json"):
-            if artifact_file.name != "project_summary.json":
-                with open(artifact_file, 'r', encoding='utf-8') as f:
-                    artifacts[artifact_file.stem] = json.load(f)
+        # List the directory off the loop, then fan the reads out so every
+        # artifact file is in flight at once instead of read back to back
+        entries = await asyncio.to_thread(_json_entries, project_dir)
+        artifact_files = [Path(e.path) for e in entries if e.name != "project_summary.json"]
+        loaded = await asyncio.gather(*(asyncio.to_thread(project_manager.load_json_cached, p) for p in artifact_files))
+        
+        header = {
+            "project_id": project_id,
+            "artifact_names": [p.stem for p in artifact_files],
+            "artifact_count": len(artifact_files),
+            "retrieved_at": datetime.now().isoformat()
+        }
+        return [types.TextContent(type="text", text=_dumps(header))] + [
+            types.TextContent(type="text", text=_dumps({"artifact": p.stem, "data": data}))
+            for p, data in zip(artifact_files, loaded)
+        ]
     else:
         # Get specific artifact
         artifact_file = project_dir / f"{artifact_type}.json"
         if artifact_file.exists():
-            with open(artifact_file, 'r', encoding='utf-8') as f:
-                artifacts[artifact_type] = json.load(f)
+            artifacts[artifact_type] = await asyncio.to_thread(project_manager.load_json_cached, artifact_file)
         else:
             raise ValueError(f"Artifact {artifact_type} not found for project {project_id}")
     
@@ -539,7 +785,7 @@ async def handle_get_project_artifacts_enhanced(arguments: Dict[str, Any]) -> Se
     
     return [types.TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=_dumps(result)
     )]
 
 
@@ -557,16 +803,18 @@ async def handle_monitor_project_progress(arguments: Dict[str, Any]) -> Sequence
     progress_percentage = (completed_phases / total_phases * 100) if total_phases > 0 else 0
     
     # Check for recent updates
-    project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
+    now = datetime.now()
+    project_dir = _project_dir(project_id)
     recent_files = []
     if project_dir.exists():
         # Get files modified in the last hour
-        one_hour_ago = datetime.now().timestamp() - 3600
-        for file_path in project_dir.glob("*.json"):
-            if file_path.stat().st_mtime > one_hour_ago:
+        one_hour_ago = now.timestamp() - 3600
+        for entry in _json_entries(project_dir):
+            mtime = entry.stat().st_mtime
+            if mtime > one_hour_ago:
                 recent_files.append({
-                    "file": file_path.name,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "file": entry.name,
+                    "modified": datetime.fromtimestamp(mtime).isoformat()
                 })
     
     result = {
@@ -579,12 +827,12 @@ async def handle_monitor_project_progress(arguments: Dict[str, Any]) -> Sequence
         "remaining_phases": [p for p in project.get("phases", []) if p not in project.get("completed_phases", [])],
         "recent_activity": recent_files,
         "last_updated": project.get("updated_at", project.get("created_at")),
-        "monitoring_timestamp": datetime.now().isoformat()
+        "monitoring_timestamp": now.isoformat()
     }
     
     return [types.TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=_dumps(result)
     )]
 
 
@@ -594,36 +842,40 @@ async def run_project_workflow_enhanced(project_id: str, specification: str):
         logger.info(f"Starting enhanced workflow for project {project_id}")
         
         # Update project status
+        started_at = datetime.now().isoformat()
         project_manager.update_project(project_id, {
             "status": "in_progress",
             "current_phase": "business_analysis",
-            "started_at": datetime.now().isoformat()
-        })
+            "started_at": started_at
+        }, now=started_at)
+        
+        # Phase tracking callback; the workflow calls it from its worker thread,
+        # so hand the update back to the event loop that owns project_manager
+        loop = asyncio.get_running_loop()
         
-        # Phase tracking callback
         def phase_completed(phase_name: str):
-            completed_phases = project_manager.get_project(project_id).get("completed_phases", [])
-            completed_phases.append(phase_name)
-            project_manager.update_project(project_id, {
-                "completed_phases": completed_phases,
-                "current_phase": get_next_phase(phase_name)
-            })
+            loop.call_soon_threadsafe(
+                project_manager.mark_phase_completed, project_id, phase_name, get_next_phase(phase_name)
+            )
         
-        # Run the LangGraph workflow with enhanced tracking
-        final_state = await run_software_development_workflow(
+        # Run the synchronous LangGraph workflow in a worker thread so it
+        # doesn't block the event loop
+        final_state = await asyncio.to_thread(
+            run_software_development_workflow,
             specification=specification,
             project_id=project_id,
             phase_callback=phase_completed
         )
         
         # Update final status
+        completed_at = datetime.now().isoformat()
         project_manager.update_project(project_id, {
             "status": "completed",
             "current_phase": "completed",
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": completed_at,
             "workflow_completed": True,
             "final_state": final_state
-        })
+        }, now=completed_at)
         
         logger.info(f"✅ Enhanced workflow completed for project {project_id}")
         
@@ -631,24 +883,26 @@ async def run_project_workflow_enhanced(project_id: str, specification: str):
         error_msg = f"Enhanced workflow failed for project {project_id}: {str(e)}"
         logger.error(error_msg)
         
+        failed_at = datetime.now().isoformat()
         project_manager.update_project(project_id, {
             "status": "failed",
             "error": error_msg,
-            "failed_at": datetime.now().isoformat()
-        })
+            "failed_at": failed_at
+        }, now=failed_at)
+
+
+# Workflow phase that follows each phase; the last one leads to "completed"
+_NEXT_PHASE = {
+    "business_analysis": "architecture",
+    "architecture": "implementation",
+    "implementation": "testing",
+    "testing": "completed"
+}
 
 
 def get_next_phase(current_phase: str) -> str:
     """Get the next phase in the workflow."""
-    phases = ["business_analysis", "architecture", "implementation", "testing"]
-    try:
-        current_index = phases.index(current_phase)
-        if current_index < len(phases) - 1:
-            return phases[current_index + 1]
-        else:
-            return "completed"
-    except ValueError:
-        return "unknown"
+    return _NEXT_PHASE.get(current_phase, "unknown")
 
 
 async def main():
@@ -660,20 +914,26 @@ async def main():
     print("📊 Real-time progress monitoring available")
     
     # Run the enhanced MCP server with stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="agentic-ecosystem-enhanced",
-                server_version="2.1.0",
-                capabilities=app.get_capabilities(
-                    notification_options=types.ClientCapabilities(),
-                    experimental_capabilities={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="agentic-ecosystem-enhanced",
+                    server_version="2.1.0",
+                    capabilities=app.get_capabilities(
+                        notification_options=types.ClientCapabilities(),
+                        experimental_capabilities={}
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        # Don't lose updates still waiting on the save debounce
+        await project_manager.flush_async()
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Disk cache for LLM responses
+
+Responses are stored one file per entry, keyed by a digest of the model name and
+the exact prompt text, and expire after a configurable TTL. The agents sample at
+a non-zero temperature, so the cache is opt-in: a TTL of zero disables it.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """File-backed cache of LLM response text with a time-to-live."""
+
+    def __init__(self, cache_dir: Path, ttl: float):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups and stores are active."""
+        return self.ttl > 0
+
+    @staticmethod
+    def cache_key(model: str, prompt: str) -> str:
+        """Build a stable cache key for a prompt sent to ``model``."""
+        payload = json.dumps({"model": model, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on a miss or an expired entry.
+        
+        Expired entries are deleted when they are read, so the cache directory
+        only keeps entries that can still be served.
+        """
+        cache_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.ttl:
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return None
+        return entry.get("content")
+
+    def set(self, key: str, content: str) -> None:
+        """Persist a response atomically so concurrent readers never see a partial file."""
+        cache_path = self.cache_dir / f"{key}.json"
+        tmp_path = cache_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"stored_at": time.time(), "content": content}, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Error caching LLM response: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
@@ -7,11 +7,19 @@ as described in: https://langchain-ai.github.io/langgraph/agents/mcp/
 
 import asyncio
 import json
+import logging
+import logging.handlers
+import mmap
+import queue
 import uuid
 import os
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Sequence
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union, Callable, Awaitable
 
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
@@ -20,372 +28,506 @@ from mcp.server.stdio import stdio_server
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; serialisation falls back to the stdlib json module
+    orjson = None
+
 from .workflow import run_software_development_workflow
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
 # Initialize the MCP server
 app = Server("agentic-ecosystem")
 
-# Track running projects
-active_projects: Dict[str, Dict[str, Any]] = {}
+# Status and phase values shared by every record; values coming back from the
+# workflow are interned too, so records share one string per distinct value
+_STATUS_INITIATED = sys.intern("initiated")
+_STATUS_RUNNING = sys.intern("running")
+_STATUS_COMPLETED = sys.intern("completed")
+_STATUS_FAILED = sys.intern("failed")
+_PHASE_INITIATING = sys.intern("initiating")
+_PHASE_WORKFLOW_STARTING = sys.intern("workflow_starting")
+
+
+@dataclass(slots=True)
+class ProjectRecord:
+    """In-memory tracking record for a project started through this server."""
+    id: str
+    title: str
+    domain: str
+    specification: str
+    status: str
+    created_at: str
+    current_phase: str
+    completed_at: Optional[str] = None
+    failed_at: Optional[str] = None
+    error: Optional[str] = None
+    workflow_completed: Optional[bool] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the record's set fields (dataclasses.asdict deep-copies every value).
+        
+        Unset optional fields are left out, so responses only carry the keys a
+        project has reached, as they did when records were plain dicts.
+        """
+        return {
+            name: value
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
+
+
+# Track running projects, least recently used first. Finished workflows leave
+# their project_summary.json on disk, which the status handler falls back to
+# once a record has been evicted.
+_MAX_ACTIVE_PROJECTS = 1024
+active_projects: "OrderedDict[str, ProjectRecord]" = OrderedDict()
+
+# Generated project output, resolved once at import time
+_OUT_ROOT = Path(__file__).resolve().parent.parent.parent / "out"
+# Handlers build per-project paths by string concatenation on this rather than
+# Path's / operator, which parses and allocates a new path object per join
+_OUT_ROOT_S = str(_OUT_ROOT)
+
+# Artifact name and the file it is stored in, in response order
+_ARTIFACT_FILES = (
+    ("business_analysis", "business_analysis.md"),
+    ("system_architecture", "system_architecture.md"),
+    ("implementation_plan", "implementation_plan.md"),
+    ("test_strategy", "test_strategy.md"),
+    ("project_summary", "project_summary.json"),
+)
+
+# Parsed project_summary.json files keyed by path, tagged with the file's mtime_ns
+_summary_cache: Dict[str, Tuple[int, Any]] = {}
+
+
+# Last whole second formatted by _now_iso and its ISO string
+_now_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO-8601 string at one-second resolution.
+    
+    Formatting is cached per wall-clock second, so bursts of calls reuse one string.
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    if _now_iso_cache[0] != second:
+        _now_iso_cache = (second, datetime.fromtimestamp(second).isoformat(timespec='seconds'))
+    return _now_iso_cache[1]
+
+
+def _project_dir(project_id: str) -> str:
+    """Return the output directory for a project's generated artifacts."""
+    return f"{_OUT_ROOT_S}{os.sep}project_{project_id}"
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON doesn't know natively: project records as dicts, anything else as str."""
+    if isinstance(obj, ProjectRecord):
+        return obj.to_dict()
+    return str(obj)
+
+
+# Responses are parsed by MCP clients, so they are compact unless MCP_PRETTY is set
+_PRETTY_JSON = os.getenv("MCP_PRETTY", "").lower() in ("1", "true", "yes")
+
+# Reused stdlib encoder for when orjson is missing; json.dumps with custom
+# options would build a fresh JSONEncoder on every call
+_JSON_ENCODER = json.JSONEncoder(
+    indent=2 if _PRETTY_JSON else None,
+    separators=None if _PRETTY_JSON else (',', ':'),
+    default=_json_default
+)
+
+
+def _dumps(data: Any) -> str:
+    """Serialise a tool response as JSON, using orjson when available."""
+    if orjson is not None:
+        # orjson encodes dataclasses such as ProjectRecord natively
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY_JSON else 0)
+        return orjson.dumps(data, option=option, default=str).decode('utf-8')
+    return _JSON_ENCODER.encode(data)
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _load_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+# Text artifacts at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_artifact(path: str) -> Any:
+    """Read an artifact file: JSON is parsed, other files are returned as text, missing files as None."""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    with f:
+        if path.endswith('.json'):
+            return _loads(f.read())
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # Decoding from the mapping skips the intermediate bytes copy of the whole file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return str(mm, 'utf-8')
+        # A single bytes -> str decode; skips the text-mode reader's newline translation pass
+        return f.read().decode('utf-8')
+
+
+def _load_summary(path: Union[str, Path]) -> Any:
+    """Load a project summary, reusing the parsed result while the file is unchanged."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    key = str(path)
+    cached = _summary_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    data = _load_json(path)
+    _summary_cache[key] = (mtime_ns, data)
+    return data
+
+
+# Tool definitions never change at runtime, so build them once at import
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="create_project",
+        description="Create a new software development project using LangGraph multi-agent workflow",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "specification": {
+                    "type": "string",
+                    "description": "Detailed project specification and requirements"
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Optional project title"
+                },
+                "domain": {
+                    "type": "string",
+                    "description": "Optional project domain (e.g., web, mobile, data)"
+                }
+            },
+            "required": ["specification"]
+        }
+    ),
+    types.Tool(
+        name="get_project_status",
+        description="Get the status and details of a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The unique project identifier"
+                }
+            },
+            "required": ["project_id"]
+        }
+    ),
+    types.Tool(
+        name="list_projects",
+        description="List all projects (active and completed)",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    types.Tool(
+        name="get_project_artifacts",
+        description="Get the generated artifacts for a completed project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "The unique project identifier"
+                }
+            },
+            "required": ["project_id"]
+        }
+    )
+]
 
 
 @app.list_tools()
 async def list_tools() -> List[types.Tool]:
     """List available tools for the agentic ecosystem."""
-    return [
-        types.Tool(
-            name="create_project",
-            description="Create a new software development project using LangGraph multi-agent workflow",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "specification": {
-                        "type": "string",
-                        "description": "Detailed project specification and requirements"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Optional project title"
-                    },
-                    "domain": {
-                        "type": "string",
-                        "description": "Optional project domain (e.g., web, mobile, data)"
-                    }
-                },
-                "required": ["specification"]
-            }
-        ),
-        types.Tool(
-            name="get_project_status",
-            description="Get the status and details of a project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "The unique project identifier"
-                    }
-                },
-                "required": ["project_id"]
-            }
-        ),
-        types.Tool(
-            name="list_projects",
-            description="List all projects (active and completed)",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        types.Tool(
-            name="get_project_artifacts",
-            description="Get the generated artifacts for a completed project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_id": {
-                        "type": "string",
-                        "description": "The unique project identifier"
-                    }
-                },
-                "required": ["project_id"]
-            }
-        )
-    ]
+    return list(_TOOLS)
+
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Tool name -> (handler, error prefix, echo project_id, extra error fields),
+# filled in by @tool_handler
+_HANDLERS: Dict[str, Tuple[ToolHandler, str, bool, Dict[str, Any]]] = {}
+
+
+def tool_handler(name: str, error_prefix: str, echo_project_id: bool = False, **error_fields: Any):
+    """Register a coroutine returning a plain dict as the handler for tool ``name``.
+    
+    Handlers simply raise on failure; call_tool turns the exception into a JSON
+    error envelope of "<error_prefix>: <exception>" plus ``error_fields``, and the
+    call's project_id when ``echo_project_id`` is set.
+    """
+    def decorator(fn: ToolHandler) -> ToolHandler:
+        _HANDLERS[name] = (fn, error_prefix, echo_project_id, error_fields)
+        return fn
+    return decorator
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
     """Handle tool calls for the agentic ecosystem."""
-    
-    if name == "create_project":
-        return await handle_create_project(arguments)
-    elif name == "get_project_status":
-        return await handle_get_project_status(arguments)
-    elif name == "list_projects":
-        return await handle_list_projects(arguments)
-    elif name == "get_project_artifacts":
-        return await handle_get_project_artifacts(arguments)
-    else:
+    entry = _HANDLERS.get(name)
+    if entry is None:
         raise ValueError(f"Unknown tool: {name}")
+    handler, error_prefix, echo_project_id, error_fields = entry
+    
+    # The only try frame on the dispatch path; handlers themselves just raise
+    try:
+        result = await handler(arguments)
+    except Exception as e:
+        message = f"missing required argument {e}" if isinstance(e, KeyError) else str(e)
+        result = {"error": f"{error_prefix}: {message}", **error_fields}
+        if echo_project_id:
+            result["project_id"] = arguments.get("project_id", "unknown")
+    return [types.TextContent(type="text", text=_dumps(result))]
 
 
-async def handle_create_project(arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
+@tool_handler("create_project", "Failed to create project", status="failed")
+async def handle_create_project(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle project creation."""
-    try:
-        specification = arguments["specification"]
-        title = arguments.get("title", "Untitled Project")
-        domain = arguments.get("domain", "General")
-        
-        # Generate unique project ID
-        project_id = str(uuid.uuid4())
-        
-        # Add to active projects tracking
-        active_projects[project_id] = {
-            "id": project_id,
-            "title": title,
-            "domain": domain,
-            "specification": specification,
-            "status": "initiated",
-            "created_at": datetime.now().isoformat(),
-            "current_phase": "initiating"
-        }
-        
-        # Run workflow in background task
-        asyncio.create_task(run_project_workflow_background(project_id, specification))
-        
-        result = {
-            "project_id": project_id,
-            "status": "initiated",
-            "message": f"Project '{title}' created successfully. LangGraph workflow starting...",
-            "created_at": datetime.now().isoformat()
-        }
-        
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
-        
-    except Exception as e:
-        error_result = {
-            "error": f"Failed to create project: {str(e)}",
-            "status": "failed"
-        }
-        return [types.TextContent(
-            type="text", 
-            text=json.dumps(error_result, indent=2)
-        )]
+    specification = arguments["specification"]
+    title = arguments.get("title", "Untitled Project")
+    domain = arguments.get("domain", "General")
+    
+    # Generate unique project ID
+    project_id = str(uuid.uuid4())
+    
+    # Add to active projects tracking, evicting the least recently used record
+    while len(active_projects) >= _MAX_ACTIVE_PROJECTS:
+        active_projects.popitem(last=False)
+    active_projects[project_id] = ProjectRecord(
+        id=project_id,
+        title=title,
+        domain=domain,
+        specification=specification,
+        status=_STATUS_INITIATED,
+        created_at=_now_iso(),
+        current_phase=_PHASE_INITIATING
+    )
+    
+    # Run workflow in background task
+    asyncio.create_task(run_project_workflow_background(project_id, specification))
+    
+    return {
+        "project_id": project_id,
+        "status": _STATUS_INITIATED,
+        "message": f"Project '{title}' created successfully. LangGraph workflow starting...",
+        "created_at": _now_iso()
+    }
 
 
-async def handle_get_project_status(arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
+@tool_handler("get_project_status", "Failed to get project status", echo_project_id=True)
+async def handle_get_project_status(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle getting project status."""
-    try:
-        project_id = arguments["project_id"]
-        
-        # Check if project exists in active tracking
-        if project_id in active_projects:
-            project = active_projects[project_id].copy()
-            
-            # Check for completion status from file system
-            project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
-            summary_file = project_dir / "project_summary.json"
-            
-            if summary_file.exists():
-                with open(summary_file, 'r', encoding='utf-8') as f:
-                    summary_data = json.load(f)
-                project.update(summary_data)
-            
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(project, indent=2)
-            )]
+    project_id = arguments["project_id"]
+    
+    # Check if project exists in active tracking
+    if project_id in active_projects:
+        active_projects.move_to_end(project_id)
         
-        # Try to load from file system
-        project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
-        if not project_dir.exists():
-            error_result = {"error": "Project not found", "project_id": project_id}
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(error_result, indent=2)
-            )]
+        # Check for completion status from file system
+        try:
+            summary_data = _load_summary(f"{_project_dir(project_id)}{os.sep}project_summary.json")
+        except FileNotFoundError:
+            summary_data = None
         
-        # Load project summary if available
-        summary_file = project_dir / "project_summary.json"
-        if summary_file.exists():
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(summary_data, indent=2)
-            )]
-        else:
-            result = {
-                "project_id": project_id, 
-                "status": "unknown", 
-                "message": "Project found but status unknown"
-            }
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2)
-            )]
-            
-    except Exception as e:
-        error_result = {
-            "error": f"Failed to get project status: {str(e)}",
-            "project_id": arguments.get("project_id", "unknown")
+        record = active_projects[project_id].to_dict()
+        return {**record, **summary_data} if summary_data else record
+    
+    # Try to load the project summary from the file system
+    project_dir = _project_dir(project_id)
+    try:
+        summary_data = _load_summary(f"{project_dir}{os.sep}project_summary.json")
+    except FileNotFoundError:
+        summary_data = None
+    
+    if summary_data is not None:
+        return summary_data
+    elif not os.path.exists(project_dir):
+        return {"error": "Project not found", "project_id": project_id}
+    else:
+        return {
+            "project_id": project_id, 
+            "status": "unknown", 
+            "message": "Project found but status unknown"
         }
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(error_result, indent=2)
-        )]
 
 
-async def handle_list_projects(arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
+@tool_handler("list_projects", "Failed to list projects")
+async def handle_list_projects(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle listing all projects."""
-    try:
-        # Get active projects
-        projects = list(active_projects.values())
-        
-        # Also scan the output directory for completed projects
-        out_dir = Path(__file__).parent.parent.parent / "out"
-        if out_dir.exists():
-            for project_dir in out_dir.glob("project_*"):
-                project_id = project_dir.name.replace("project_", "")
-                if project_id not in active_projects:
-                    summary_file = project_dir / "project_summary.json"
-                    if summary_file.exists():
-                        try:
-                            with open(summary_file, 'r', encoding='utf-8') as f:
-                                summary_data = json.load(f)
-                            projects.append(summary_data)
-                        except Exception:
-                            pass  # Skip corrupted files
-        
-        result = {
-            "projects": projects,
-            "total_count": len(projects),
-            "active_count": len(active_projects),
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
+    # Get active projects
+    projects = list(active_projects.values())
+    
+    # Also scan the output directory for completed projects
+    if os.path.exists(_OUT_ROOT_S):
+        with os.scandir(_OUT_ROOT_S) as it:
+            project_entries = [
+                e for e in it
+                if e.name.startswith("project_") and e.is_dir(follow_symlinks=False)
+            ]
+        summary_files = []
+        for entry in project_entries:
+            project_id = entry.name[len("project_"):]
+            if project_id not in active_projects:
+                summary_files.append(f"{entry.path}{os.sep}project_summary.json")
         
-    except Exception as e:
-        error_result = {
-            "error": f"Failed to list projects: {str(e)}"
-        }
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(error_result, indent=2)
-        )]
+        # Read the summaries concurrently off the event loop; projects
+        # without a summary yet raise FileNotFoundError and are skipped
+        summaries = await asyncio.gather(
+            *(asyncio.to_thread(_load_summary, f) for f in summary_files),
+            return_exceptions=True
+        )
+        # Skip corrupted files
+        projects.extend(data for data in summaries if not isinstance(data, Exception))
+    
+    return {
+        "projects": projects,
+        "total_count": len(projects),
+        "active_count": len(active_projects),
+        "timestamp": _now_iso()
+    }
 
 
-async def handle_get_project_artifacts(arguments: Dict[str, Any]) -> Sequence[types.TextContent]:
+@tool_handler("get_project_artifacts", "Failed to get project artifacts", echo_project_id=True)
+async def handle_get_project_artifacts(arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Handle getting project artifacts."""
-    try:
-        project_id = arguments["project_id"]
-        
-        # Check if project directory exists
-        project_dir = Path(__file__).parent.parent.parent / "out" / f"project_{project_id}"
-        if not project_dir.exists():
-            error_result = {"error": "Project not found", "project_id": project_id}
-            return [types.TextContent(
-                type="text",
-                text=json.dumps(error_result, indent=2)
-            )]
-        
-        # List all artifacts
-        artifacts = {}
-        
-        # Check for each expected artifact type
-        artifact_files = {
-            "business_analysis": "business_analysis.md",
-            "system_architecture": "system_architecture.md", 
-            "implementation_plan": "implementation_plan.md",
-            "test_strategy": "test_strategy.md",
-            "project_summary": "project_summary.json"
-        }
-        
-        for artifact_type, filename in artifact_files.items():
-            file_path = project_dir / filename
-            if file_path.exists():
-                try:
-                    if filename.endswith('.json'):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            artifacts[artifact_type] = json.load(f)
-                    else:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            artifacts[artifact_type] = f.read()
-                except Exception as e:
-                    artifacts[artifact_type] = f"Error reading file: {str(e)}"
-            else:
-                artifacts[artifact_type] = None
-        
-        result = {
-            "project_id": project_id,
-            "artifacts": artifacts,
-            "artifacts_available": {k: v is not None for k, v in artifacts.items()},
-            "retrieved_at": datetime.now().isoformat()
-        }
-        
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(result, indent=2)
-        )]
-        
-    except Exception as e:
-        error_result = {
-            "error": f"Failed to get project artifacts: {str(e)}",
-            "project_id": arguments.get("project_id", "unknown")
-        }
-        return [types.TextContent(
-            type="text",
-            text=json.dumps(error_result, indent=2)
-        )]
+    project_id = arguments["project_id"]
+    
+    # Check if project directory exists
+    project_dir = _project_dir(project_id)
+    if not os.path.exists(project_dir):
+        return {"error": "Project not found", "project_id": project_id}
+    
+    # List all artifacts
+    artifacts = {}
+    
+    # Check for each expected artifact type, reading them concurrently
+    contents = await asyncio.gather(
+        *(asyncio.to_thread(_read_artifact, project_dir + os.sep + filename) for _, filename in _ARTIFACT_FILES),
+        return_exceptions=True
+    )
+    for (artifact_type, _), content in zip(_ARTIFACT_FILES, contents):
+        if isinstance(content, Exception):
+            artifacts[artifact_type] = f"Error reading file: {str(content)}"
+        else:
+            artifacts[artifact_type] = content
+    
+    return {
+        "project_id": project_id,
+        "artifacts": artifacts,
+        "artifacts_available": {k: v is not None for k, v in artifacts.items()},
+        "retrieved_at": _now_iso()
+    }
 
 
 async def run_project_workflow_background(project_id: str, specification: str):
     """Run the LangGraph workflow for a project in background."""
     try:
-        print(f"🔄 Starting LangGraph workflow for project {project_id}")
+        logger.info("🔄 Starting LangGraph workflow for project %s", project_id)
         
         # Update project status
-        if project_id in active_projects:
-            active_projects[project_id]["status"] = "running"
-            active_projects[project_id]["current_phase"] = "workflow_starting"
+        record = active_projects.get(project_id)
+        if record is not None:
+            record.status = _STATUS_RUNNING
+            record.current_phase = _PHASE_WORKFLOW_STARTING
         
-        # Run the LangGraph workflow
-        final_state = run_software_development_workflow(specification, project_id)
+        # Run the LangGraph workflow in a worker thread; it is synchronous and
+        # would otherwise block the event loop for the whole run
+        final_state = await asyncio.to_thread(run_software_development_workflow, specification, project_id)
         
         # Update project status with final results
-        if project_id in active_projects:
-            active_projects[project_id].update({
-                "status": final_state.get("status", "completed"),
-                "current_phase": final_state.get("current_phase", "completed"),
-                "completed_at": datetime.now().isoformat(),
-                "workflow_completed": True
-            })
+        if record is not None:
+            record.status = sys.intern(final_state.get("status", _STATUS_COMPLETED))
+            record.current_phase = sys.intern(final_state.get("current_phase", _STATUS_COMPLETED))
+            record.completed_at = _now_iso()
+            record.workflow_completed = True
         
-        print(f"✅ LangGraph workflow completed for project {project_id}")
+        logger.info("✅ LangGraph workflow completed for project %s", project_id)
         
     except Exception as e:
         error_msg = f"Workflow failed for project {project_id}: {str(e)}"
-        print(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         
-        if project_id in active_projects:
-            active_projects[project_id].update({
-                "status": "failed",
-                "error": error_msg,
-                "failed_at": datetime.now().isoformat()
-            })
+        record = active_projects.get(project_id)
+        if record is not None:
+            record.status = _STATUS_FAILED
+            record.error = error_msg
+            record.failed_at = _now_iso()
+
+
+# Built once after all handlers are registered, so capability introspection
+# isn't repeated on every (re)start of the stdio transport
+_INIT_OPTS = InitializationOptions(
+    server_name="agentic-ecosystem",
+    server_version="2.0.0",
+    capabilities=app.get_capabilities(
+        notification_options=types.ClientCapabilities(),
+        experimental_capabilities={}
+    ),
+)
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Route log records through a queue so stderr writes happen on a background thread.
+    
+    Records go to stderr rather than stdout, which carries the MCP stdio protocol.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 async def main():
     """Main entry point for the MCP server."""
-    print("🚀 Starting Agentic Ecosystem MCP Server...")
-    print("📡 Using proper Model Context Protocol implementation")
-    print("🤖 LangGraph multi-agent workflows enabled")
-    
-    # Run the MCP server with stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="agentic-ecosystem",
-                server_version="2.0.0",
-                capabilities=app.get_capabilities(
-                    notification_options=types.ClientCapabilities(),
-                    experimental_capabilities={}
-                ),
-            ),
-        )
+    listener = _start_log_listener()
+    try:
+        logger.info("🚀 Starting Agentic Ecosystem MCP Server...")
+        logger.info("📡 Using proper Model Context Protocol implementation")
+        logger.info("🤖 LangGraph multi-agent workflows enabled")
+        
+        # Run the MCP server with stdio transport
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, _INIT_OPTS)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
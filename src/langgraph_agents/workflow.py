@@ -8,34 +8,125 @@ Based on LangChain best practices and the Agent-Experiments repository:
 https://github.com/kabir12345/Agent-Experiments
 """
 
+import asyncio
+import inspect
 import os
 import json
+import logging
+import threading
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any, TypedDict, Annotated
-from pathlib import Path
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import cache, cached_property, partial
+from typing import Dict, List, Optional, Any, Callable, Tuple, TypedDict, Annotated
 
-from langchain import hub
-from langchain.tools import tool
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langchain_openai import ChatOpenAI
-from langchain.agents import AgentExecutor, create_structured_chat_agent
 from langgraph.graph import StateGraph, START, END
-from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph.message import add_messages
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; serialisation falls back to the stdlib json module
+    orjson = None
+
 from .agent_tools import (
     analyze_business_requirements,
     design_system_architecture,
     generate_implementation_plan,
-    create_test_strategy
+    create_test_strategy,
+    http_async_client,
+    http_client,
+    _OUT_ROOT,
+    _ensure_dir,
+    _write_file
 )
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
+
+# (epoch second, ISO string) of the last timestamp handed out by _timestamp
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """ISO-8601 local time to the second for workflow messages and reports.
+    
+    Phases finishing within the same second share one formatted string.
+    """
+    global _last_timestamp
+    second = int(time.time())
+    if _last_timestamp[0] != second:
+        _last_timestamp = (second, datetime.fromtimestamp(second).isoformat(timespec='seconds'))
+    return _last_timestamp[1]
+
+
+def _json_text(data: Any) -> str:
+    """Serialise a phase result into the JSON text the next agent tool takes as input."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str).decode('utf-8')
+    return json.dumps(data, default=str)
+
+
+def _threaded_node(func, name: Optional[str] = None) -> RunnableLambda:
+    """Wrap a synchronous graph node so ainvoke runs it on a worker thread.
+    
+    The nodes block on LLM calls and file writes; under the async graph they would
+    otherwise run on the event loop and stall everything else scheduled on it.
+    """
+    async def afunc(state, config):
+        return await asyncio.to_thread(func, state, config)
+    return RunnableLambda(func, afunc=afunc, name=name or func.__name__)
+
+
+def _log_callback_error(phase_name: str, future: Future) -> None:
+    """Log an exception raised by an async phase callback scheduled from a node."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Phase callback for %s failed: %s", phase_name, future.exception())
+
+
+def _report_json(report: Dict[str, Any]) -> bytes:
+    """Serialise a summary report as indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Markdown summary layout, filled from the summary report by _generate_markdown_summary
+_MD_TEMPLATE = """# Project Summary
+
+**Project ID:** {project_id}
+**Status:** {status}
+**Completed:** {completed_at}
+
+## Original Specification
+{specification}
+
+## Artifacts Generated
+- **Business Analysis:** {business_analysis}
+- **System Architecture:** {system_architecture}
+- **Implementation Plan:** {implementation_plan}
+- **Test Strategy:** {test_strategy}
+
+## Summary Statistics
+- **User Stories:** {user_stories_count}
+- **System Components:** {components_count}
+- **Implementation Phases:** {implementation_phases}
+- **Test Cases:** {test_cases_count}
+
+"""
+_MD_FOOTER = "---\n*Generated by LangGraph Multi-Agent Workflow*\n"
+
+
 # Define the state structure for the workflow
 class ProjectState(TypedDict):
     """State structure for the software development workflow."""
@@ -50,6 +141,99 @@ class ProjectState(TypedDict):
     errors: List[str]
     status: str  # "in_progress", "completed", "failed"
 
+@dataclass(frozen=True)
+class _Phase:
+    """One agent phase: the tool it calls and how its result lands in the project state."""
+    label: str
+    emoji: str
+    tool: Any
+    payload: Callable[[ProjectState], Dict[str, Any]]
+    state_key: str
+    count_key: str
+    count_noun: str
+    summary_key: str
+    completed_phase: str
+    callback_name: str
+    message: str
+
+
+# Agent phases keyed by graph node name, in workflow order. Each phase hands the
+# previous phase's result to its tool as JSON text.
+_PHASES: Dict[str, _Phase] = {
+    "business_analysis": _Phase(
+        label="Business Analysis",
+        emoji="🔍",
+        tool=analyze_business_requirements,
+        payload=lambda state: {
+            "specification": state["original_specification"],
+            "project_id": state["project_id"]
+        },
+        state_key="business_analysis",
+        count_key="user_stories",
+        count_noun="user stories",
+        summary_key="user_stories_count",
+        completed_phase="business_analysis_completed",
+        callback_name="business_analysis",
+        message="Business analysis completed. Generated {count} user stories."
+    ),
+    "architecture_design": _Phase(
+        label="Architecture Design",
+        emoji="🏗️",
+        tool=design_system_architecture,
+        payload=lambda state: {
+            "user_stories": _json_text(state.get("business_analysis", {})),
+            "project_id": state["project_id"],
+            "requirements": state["original_specification"]
+        },
+        state_key="system_architecture",
+        count_key="components",
+        count_noun="components",
+        summary_key="components_count",
+        completed_phase="architecture_design_completed",
+        callback_name="architecture",
+        message="System architecture designed with {count} components."
+    ),
+    "implementation_planning": _Phase(
+        label="Implementation Planning",
+        emoji="💻",
+        tool=generate_implementation_plan,
+        payload=lambda state: {
+            "architecture": _json_text(state.get("system_architecture", {})),
+            "project_id": state["project_id"]
+        },
+        state_key="implementation_plan",
+        count_key="implementation_phases",
+        count_noun="phases",
+        summary_key="implementation_phases",
+        completed_phase="implementation_planning_completed",
+        callback_name="implementation",
+        message="Implementation plan created with {count} phases."
+    ),
+    "test_strategy_creation": _Phase(
+        label="Test Strategy Creation",
+        emoji="🧪",
+        tool=create_test_strategy,
+        payload=lambda state: {
+            "implementation_plan": _json_text(state.get("implementation_plan", {})),
+            "project_id": state["project_id"]
+        },
+        state_key="test_strategy",
+        count_key="test_cases",
+        count_noun="test cases",
+        summary_key="test_cases_count",
+        completed_phase="test_strategy_completed",
+        callback_name="testing",
+        message="Test strategy created with {count} test cases."
+    )
+}
+
+
+@cache
+def _checkpointer() -> MemorySaver:
+    """The process-wide checkpointer shared by every workflow instance."""
+    return MemorySaver()
+
+
 class SoftwareDevelopmentWorkflow:
     """
     LangGraph-based multi-agent workflow for software development.
@@ -62,29 +246,54 @@ class SoftwareDevelopmentWorkflow:
     """
     
     def __init__(self):
-        self.llm = ChatOpenAI(
+        # Checkpointer behind the shared checkpointed graph
+        self.memory = _checkpointer()
+    
+    @cached_property
+    def llm(self) -> ChatOpenAI:
+        """Chat model for the workflow, created on first use.
+        
+        It shares the agent tools' pooled HTTP clients, so workflow and tool calls
+        reuse the same keep-alive connections to the API.
+        """
+        return ChatOpenAI(
             model_name=os.getenv("OPENAI_MODEL", "gpt-4"),
-            temperature=0.7
+            temperature=0.7,
+            http_client=http_client,
+            http_async_client=http_async_client
         )
+    
+    @property
+    def workflow(self):
+        """The workflow compiled with checkpointing, for runs that may be resumed."""
+        return self._compiled_workflow(checkpointed=True)
+    
+    @property
+    def _workflow_uncheckpointed(self):
+        """The workflow compiled without a checkpointer, for single-shot runs."""
+        return self._compiled_workflow(checkpointed=False)
+    
+    @classmethod
+    @cache
+    def _compiled_workflow(cls, checkpointed: bool):
+        """Compile the workflow once per process; every instance shares the result.
         
-        # Create memory saver for checkpointing
-        self.memory = MemorySaver()
-        
-        # Build the workflow graph
-        self.workflow = self._build_workflow()
+        Nothing in the graph is bound to an instance: each run's phase callback
+        reaches the nodes through the invocation config.
+        """
+        return cls._build_workflow().compile(checkpointer=_checkpointer() if checkpointed else None)
         
-    def _build_workflow(self) -> StateGraph:
+    @classmethod
+    def _build_workflow(cls) -> StateGraph:
         """Build the LangGraph workflow state machine."""
         
         # Create the state graph
         workflow = StateGraph(ProjectState)
         
         # Add nodes for each agent/phase
-        workflow.add_node("business_analysis", self._business_analysis_node)
-        workflow.add_node("architecture_design", self._architecture_design_node)
-        workflow.add_node("implementation_planning", self._implementation_planning_node)
-        workflow.add_node("test_strategy_creation", self._test_strategy_node)
-        workflow.add_node("completion", self._completion_node)
+        for node_name, phase in _PHASES.items():
+            workflow.add_node(node_name, _threaded_node(partial(cls._run_phase, phase=phase), node_name))
+        workflow.add_node("completion", _threaded_node(cls._completion_node))
         
         # Define the workflow edges
         workflow.add_edge(START, "business_analysis")
@@ -94,248 +303,143 @@ class SoftwareDevelopmentWorkflow:
         workflow.add_edge("test_strategy_creation", "completion")
         workflow.add_edge("completion", END)
         
-        # Compile the workflow with checkpointing
-        return workflow.compile(checkpointer=self.memory)
+        return workflow
     
-    def _business_analysis_node(self, state: ProjectState) -> ProjectState:
-        """Business Analysis phase - analyze requirements and create user stories."""
-        try:
-            print(f"🔍 Starting Business Analysis for project {state['project_id']}")
-            
-            # Call the business analysis tool
-            result = analyze_business_requirements.invoke({
-                "specification": state["original_specification"],
-                "project_id": state["project_id"]
-            })
-            
-            # Update state
-            state["business_analysis"] = result
-            state["current_phase"] = "business_analysis_completed"
-            state["messages"].append({
-                "role": "assistant",
-                "content": f"Business analysis completed. Generated {len(result.get('user_stories', []))} user stories.",
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            print(f"✅ Business Analysis completed with {len(result.get('user_stories', []))} user stories")
-            
-            # Call phase completion callback if provided
-            if hasattr(self, 'phase_callback') and self.phase_callback:
-                self.phase_callback("business_analysis")
-            
-        except Exception as e:
-            error_msg = f"Business analysis failed: {str(e)}"
-            state["errors"].append(error_msg)
-            state["status"] = "failed"
-            print(f"❌ {error_msg}")
-            
-        return state
-    
-    def _architecture_design_node(self, state: ProjectState) -> ProjectState:
-        """Architecture Design phase - design system architecture."""
-        try:
-            print(f"🏗️ Starting Architecture Design for project {state['project_id']}")
-            
-            # Prepare user stories data for architect
-            user_stories_json = json.dumps(state.get("business_analysis", {}))
-            
-            # Call the architecture design tool
-            result = design_system_architecture.invoke({
-                "user_stories": user_stories_json,
-                "project_id": state["project_id"],
-                "requirements": state["original_specification"]
-            })
-            
-            # Update state
-            state["system_architecture"] = result
-            state["current_phase"] = "architecture_design_completed"
-            state["messages"].append({
-                "role": "assistant",
-                "content": f"System architecture designed with {len(result.get('components', []))} components.",
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            print(f"✅ Architecture Design completed with {len(result.get('components', []))} components")
-            
-            # Call phase completion callback if provided
-            if hasattr(self, 'phase_callback') and self.phase_callback:
-                self.phase_callback("architecture")
-            
-        except Exception as e:
-            error_msg = f"Architecture design failed: {str(e)}"
-            state["errors"].append(error_msg)
-            state["status"] = "failed"
-            print(f"❌ {error_msg}")
-            
-        return state
-    
-    def _implementation_planning_node(self, state: ProjectState) -> ProjectState:
-        """Implementation Planning phase - create development plan."""
-        try:
-            print(f"💻 Starting Implementation Planning for project {state['project_id']}")
-            
-            # Prepare architecture data for developer
-            architecture_json = json.dumps(state.get("system_architecture", {}))
-            
-            # Call the implementation planning tool
-            result = generate_implementation_plan.invoke({
-                "architecture": architecture_json,
-                "project_id": state["project_id"]
-            })
-            
-            # Update state
-            state["implementation_plan"] = result
-            state["current_phase"] = "implementation_planning_completed"
-            state["messages"].append({
-                "role": "assistant",
-                "content": f"Implementation plan created with {len(result.get('implementation_phases', []))} phases.",
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            print(f"✅ Implementation Planning completed with {len(result.get('implementation_phases', []))} phases")
-            
-            # Call phase completion callback if provided
-            if hasattr(self, 'phase_callback') and self.phase_callback:
-                self.phase_callback("implementation")
-            
-        except Exception as e:
-            error_msg = f"Implementation planning failed: {str(e)}"
-            state["errors"].append(error_msg)
-            state["status"] = "failed"
-            print(f"❌ {error_msg}")
-            
-        return state
-    
-    def _test_strategy_node(self, state: ProjectState) -> ProjectState:
-        """Test Strategy phase - create testing strategy."""
+    @staticmethod
+    def _run_phase(state: ProjectState, config: RunnableConfig, phase: _Phase) -> Dict[str, Any]:
+        """Run one agent phase: call its tool, record the result and notify the callback.
+        
+        Returns only the state keys the phase changed; LangGraph merges them into the
+        state, appending to messages through its add_messages reducer.
+        """
         try:
-            print(f"🧪 Starting Test Strategy Creation for project {state['project_id']}")
-            
-            # Prepare implementation plan data for tester
-            implementation_json = json.dumps(state.get("implementation_plan", {}))
-            
-            # Call the test strategy tool
-            result = create_test_strategy.invoke({
-                "implementation_plan": implementation_json,
-                "project_id": state["project_id"]
-            })
-            
-            # Update state
-            state["test_strategy"] = result
-            state["current_phase"] = "test_strategy_completed"
-            state["messages"].append({
-                "role": "assistant",
-                "content": f"Test strategy created with {len(result.get('test_cases', []))} test cases.",
-                "timestamp": datetime.now().isoformat()
-            })
+            logger.info("%s Starting %s for project %s", phase.emoji, phase.label, state['project_id'])
+            
+            result = phase.tool.invoke(phase.payload(state))
+            count = len(result.get(phase.count_key, []))
+            
+            update = {
+                phase.state_key: result,
+                "current_phase": phase.completed_phase,
+                "messages": [{
+                    "role": "assistant",
+                    "content": phase.message.format(count=count),
+                    "timestamp": _timestamp()
+                }]
+            }
             
-            print(f"✅ Test Strategy completed with {len(result.get('test_cases', []))} test cases")
+            logger.info("✅ %s completed with %d %s", phase.label, count, phase.count_noun)
             
             # Call phase completion callback if provided
-            if hasattr(self, 'phase_callback') and self.phase_callback:
-                self.phase_callback("testing")
+            phase_callback = config.get("configurable", {}).get("phase_callback")
+            if phase_callback:
+                phase_callback(phase.callback_name)
             
         except Exception as e:
-            error_msg = f"Test strategy creation failed: {str(e)}"
-            state["errors"].append(error_msg)
-            state["status"] = "failed"
-            print(f"❌ {error_msg}")
+            error_msg = f"{phase.label.capitalize()} failed: {str(e)}"
+            update = {"errors": [*state["errors"], error_msg], "status": "failed"}
+            logger.error("❌ %s", error_msg)
             
-        return state
+        return update
     
-    def _completion_node(self, state: ProjectState) -> ProjectState:
+    @classmethod
+    def _completion_node(cls, state: ProjectState, config: RunnableConfig) -> Dict[str, Any]:
         """Completion phase - finalize the project."""
-        print(f"🎉 Completing project {state['project_id']}")
+        logger.info("🎉 Completing project %s", state['project_id'])
         
-        state["current_phase"] = "completed"
-        state["status"] = "completed" if not state["errors"] else "completed_with_errors"
-        state["messages"].append({
-            "role": "assistant",
-            "content": "Software development workflow completed successfully!",
-            "timestamp": datetime.now().isoformat()
-        })
+        update = {
+            "current_phase": "completed",
+            "status": "completed" if not state["errors"] else "completed_with_errors",
+            "messages": [{
+                "role": "assistant",
+                "content": "Software development workflow completed successfully!",
+                "timestamp": _timestamp()
+            }]
+        }
         
         # Generate summary report
-        self._generate_summary_report(state)
+        cls._generate_summary_report({**state, **update})
         
-        print(f"✅ Project {state['project_id']} completed!")
-        return state
+        logger.info("✅ Project %s completed!", state['project_id'])
+        return update
     
-    def _generate_summary_report(self, state: ProjectState) -> None:
+    @classmethod
+    def _generate_summary_report(cls, state: ProjectState) -> None:
         """Generate a comprehensive summary report."""
         try:
+            # One pass over the phases; a phase that failed left its result as None
+            artifacts_generated = {}
+            summary = {}
+            for phase in _PHASES.values():
+                result = state.get(phase.state_key)
+                artifacts_generated[phase.state_key] = result is not None
+                summary[phase.summary_key] = len(result.get(phase.count_key, ())) if result else 0
+            
             report = {
                 "project_id": state["project_id"],
                 "specification": state["original_specification"],
                 "status": state["status"],
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": _timestamp(),
                 "phases_completed": state["current_phase"],
-                "artifacts_generated": {
-                    "business_analysis": state.get("business_analysis") is not None,
-                    "system_architecture": state.get("system_architecture") is not None,
-                    "implementation_plan": state.get("implementation_plan") is not None,
-                    "test_strategy": state.get("test_strategy") is not None
-                },
+                "artifacts_generated": artifacts_generated,
                 "errors": state["errors"],
-                "summary": {
-                    "user_stories_count": len(state.get("business_analysis", {}).get("user_stories", [])),
-                    "components_count": len(state.get("system_architecture", {}).get("components", [])),
-                    "implementation_phases": len(state.get("implementation_plan", {}).get("implementation_phases", [])),
-                    "test_cases_count": len(state.get("test_strategy", {}).get("test_cases", []))
-                }
+                "summary": summary
             }
             
             # Save summary report
-            base_dir = Path(__file__).parent.parent.parent / "out" / f"project_{state['project_id']}"
-            base_dir.mkdir(parents=True, exist_ok=True)
+            # The agent tools have usually created this directory already; _ensure_dir
+            # shares their per-process cache so no mkdir syscalls are repeated, and
+            # _write_file recreates the directory if it was removed after being cached
+            base_dir = _ensure_dir(_OUT_ROOT / f"project_{state['project_id']}")
             
-            with open(base_dir / "project_summary.json", 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            _write_file(base_dir / "project_summary.json", _report_json(report))
                 
             # Generate markdown summary
-            md_content = self._generate_markdown_summary(report)
-            with open(base_dir / "project_summary.md", 'w', encoding='utf-8') as f:
-                f.write(md_content)
+            md_content = cls._generate_markdown_summary(report)
+            _write_file(base_dir / "project_summary.md", md_content)
                 
         except Exception as e:
-            print(f"Error generating summary report: {e}")
+            logger.error("Error generating summary report: %s", e)
     
-    def _generate_markdown_summary(self, report: Dict[str, Any]) -> str:
+    @staticmethod
+    def _generate_markdown_summary(report: Dict[str, Any]) -> str:
         """Generate markdown summary report."""
-        md = f"""# Project Summary
-
-**Project ID:** {report['project_id']}
-**Status:** {report['status']}
-**Completed:** {report['completed_at']}
-
-## Original Specification
-{report['specification']}
-
-## Artifacts Generated
-- **Business Analysis:** {'✅' if report['artifacts_generated']['business_analysis'] else '❌'}
-- **System Architecture:** {'✅' if report['artifacts_generated']['system_architecture'] else '❌'}
-- **Implementation Plan:** {'✅' if report['artifacts_generated']['implementation_plan'] else '❌'}
-- **Test Strategy:** {'✅' if report['artifacts_generated']['test_strategy'] else '❌'}
-
-## Summary Statistics
-- **User Stories:** {report['summary']['user_stories_count']}
-- **System Components:** {report['summary']['components_count']}
-- **Implementation Phases:** {report['summary']['implementation_phases']}
-- **Test Cases:** {report['summary']['test_cases_count']}
-
-"""
+        fields = {
+            "project_id": report['project_id'],
+            "status": report['status'],
+            "completed_at": report['completed_at'],
+            "specification": report['specification'],
+            **{name: '✅' if generated else '❌' for name, generated in report['artifacts_generated'].items()},
+            **report['summary']
+        }
+        parts = [_MD_TEMPLATE.format_map(fields)]
         
         if report['errors']:
-            md += "## Errors Encountered\n"
-            for error in report['errors']:
-                md += f"- {error}\n"
-            md += "\n"
+            parts.append("## Errors Encountered\n")
+            parts.extend(f"- {error}\n" for error in report['errors'])
+            parts.append("\n")
         
-        md += "---\n*Generated by LangGraph Multi-Agent Workflow*\n"
+        parts.append(_MD_FOOTER)
+        return "".join(parts)
+    
+    @staticmethod
+    def _schedule_on_loop(callback, loop: asyncio.AbstractEventLoop, pending: List[Future]):
+        """Adapt an async phase callback for the synchronous graph nodes.
         
-        return md
+        Under ainvoke the nodes run on worker threads (see _threaded_node), so each
+        phase notification is handed back to the caller's loop and runs concurrently
+        with the next phase instead of being created and never awaited. The futures
+        are collected in ``pending`` so the caller can wait for them, and a failing
+        callback is logged rather than lost.
+        """
+        def schedule(phase_name: str) -> None:
+            future = asyncio.run_coroutine_threadsafe(callback(phase_name), loop)
+            future.add_done_callback(partial(_log_callback_error, phase_name))
+            pending.append(future)
+        return schedule
     
-    async def arun_project(self, specification: str, project_id: Optional[str] = None, phase_callback=None) -> Dict[str, Any]:
+    async def arun_project(self, specification: str, project_id: Optional[str] = None, phase_callback=None,
+                           checkpoint: bool = False) -> Dict[str, Any]:
         """
         Async version - Run the complete software development workflow.
         
@@ -343,6 +447,8 @@ class SoftwareDevelopmentWorkflow:
             specification: The business specification/requirements
             project_id: Optional project ID (will generate if not provided)
             phase_callback: Optional callback function called when each phase completes
+            checkpoint: Save every state transition to the checkpointer so the run can
+                be resumed; off by default since runs are not resumed
             
         Returns:
             Dictionary containing the final project state
@@ -350,11 +456,12 @@ class SoftwareDevelopmentWorkflow:
         if not project_id:
             project_id = str(uuid.uuid4())
         
-        # Store callback for use in nodes
-        self.phase_callback = phase_callback
+        pending_callbacks: List[Future] = []
+        if inspect.iscoroutinefunction(phase_callback):
+            phase_callback = self._schedule_on_loop(phase_callback, asyncio.get_running_loop(), pending_callbacks)
         
-        print(f"🚀 Starting software development workflow for project: {project_id}")
-        print(f"📝 Specification: {specification[:100]}...")
+        logger.info("🚀 Starting software development workflow for project: %s", project_id)
+        logger.info("📝 Specification: %.100s...", specification)
         
         # Initialize state
         initial_state = ProjectState(
@@ -368,7 +475,7 @@ class SoftwareDevelopmentWorkflow:
             messages=[{
                 "role": "system",
                 "content": "Starting software development workflow",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _timestamp()
             }],
             errors=[],
             status="in_progress"
@@ -380,23 +487,32 @@ class SoftwareDevelopmentWorkflow:
                 "configurable": {
                     "thread_id": project_id,
                     "checkpoint_ns": "software_development",
-                    "checkpoint_id": str(uuid.uuid4())
+                    "checkpoint_id": str(uuid.uuid4()),
+                    "phase_callback": phase_callback
                 },
                 "recursion_limit": 10
             }
-            final_state = await self.workflow.ainvoke(initial_state, config=config)
+            graph = self.workflow if checkpoint else self._workflow_uncheckpointed
+            final_state = await graph.ainvoke(initial_state, config=config)
             
-            print(f"🎯 Workflow completed for project {project_id}")
+            logger.info("🎯 Workflow completed for project %s", project_id)
             return final_state
             
         except Exception as e:
             error_msg = f"Workflow execution failed: {str(e)}"
-            print(f"💥 {error_msg}")
+            logger.error("💥 %s", error_msg)
             initial_state["errors"].append(error_msg)
             initial_state["status"] = "failed"
             return initial_state
+        
+        finally:
+            # Let the last phase notifications finish before the caller sees the result;
+            # failures were already logged by _log_callback_error
+            if pending_callbacks:
+                await asyncio.gather(*map(asyncio.wrap_future, pending_callbacks), return_exceptions=True)
 
-    def run_project(self, specification: str, project_id: Optional[str] = None, phase_callback=None) -> Dict[str, Any]:
+    def run_project(self, specification: str, project_id: Optional[str] = None, phase_callback=None,
+                    checkpoint: bool = False) -> Dict[str, Any]:
         """
         Run the complete software development workflow.
         
@@ -404,6 +520,8 @@ class SoftwareDevelopmentWorkflow:
             specification: The business specification/requirements
             project_id: Optional project ID (will generate if not provided)
             phase_callback: Optional callback function called when each phase completes
+            checkpoint: Save every state transition to the checkpointer so the run can
+                be resumed; off by default since runs are not resumed
             
         Returns:
             Dictionary containing the final project state
@@ -411,11 +529,8 @@ class SoftwareDevelopmentWorkflow:
         if not project_id:
             project_id = str(uuid.uuid4())
         
-        # Store callback for use in nodes
-        self.phase_callback = phase_callback
-        
-        print(f"🚀 Starting software development workflow for project: {project_id}")
-        print(f"📝 Specification: {specification[:100]}...")
+        logger.info("🚀 Starting software development workflow for project: %s", project_id)
+        logger.info("📝 Specification: %.100s...", specification)
         
         # Initialize state
         initial_state = ProjectState(
@@ -429,7 +544,7 @@ class SoftwareDevelopmentWorkflow:
             messages=[{
                 "role": "system",
                 "content": "Starting software development workflow",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _timestamp()
             }],
             errors=[],
             status="in_progress"
@@ -437,21 +552,41 @@ class SoftwareDevelopmentWorkflow:
         
         # Run the workflow
         try:
-            config = {"configurable": {"thread_id": project_id}}
-            final_state = self.workflow.invoke(initial_state, config=config)
+            config = {"configurable": {"thread_id": project_id, "phase_callback": phase_callback}}
+            graph = self.workflow if checkpoint else self._workflow_uncheckpointed
+            final_state = graph.invoke(initial_state, config=config)
             
-            print(f"🎯 Workflow completed for project {project_id}")
+            logger.info("🎯 Workflow completed for project %s", project_id)
             return final_state
             
         except Exception as e:
             error_msg = f"Workflow execution failed: {str(e)}"
-            print(f"💥 {error_msg}")
+            logger.error("💥 %s", error_msg)
             initial_state["errors"].append(error_msg)
             initial_state["status"] = "failed"
             return initial_state
 
-# Create a global instance for easy access
-workflow_instance = SoftwareDevelopmentWorkflow()
+# Shared instance, created on first use so importing this module stays cheap
+_workflow_instance: Optional[SoftwareDevelopmentWorkflow] = None
+_workflow_instance_lock = threading.Lock()
+
+
+def get_workflow_instance() -> SoftwareDevelopmentWorkflow:
+    """Return the shared workflow instance, creating it on first call."""
+    global _workflow_instance
+    if _workflow_instance is None:
+        with _workflow_instance_lock:
+            if _workflow_instance is None:
+                _workflow_instance = SoftwareDevelopmentWorkflow()
+    return _workflow_instance
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the module-level workflow_instance name working without building it at import
+    if name == "workflow_instance":
+        return get_workflow_instance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def run_software_development_workflow(specification: str, project_id: Optional[str] = None, phase_callback=None) -> Dict[str, Any]:
     """
@@ -465,12 +600,13 @@ def run_software_development_workflow(specification: str, project_id: Optional[s
     Returns:
         Final project state dictionary
     """
-    return workflow_instance.run_project(specification, project_id, phase_callback)
+    return get_workflow_instance().run_project(specification, project_id, phase_callback)
 
 # Export main functions
 __all__ = [
     'SoftwareDevelopmentWorkflow',
     'ProjectState',
     'run_software_development_workflow',
+    'get_workflow_instance',
     'workflow_instance'
 ]
@@ -8,15 +8,28 @@ and provides RESTful APIs for external system integration.
 import asyncio
 import json
 import uuid
-from typing import Dict, List, Optional, Any
+from typing import ClassVar, Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 import uvicorn
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; responses fall back to the stdlib json module
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop (installed with uvicorn[standard]) is optional; asyncio's default loop is used otherwise
+    uvloop = None
+
 from ..orchestrator.orchestrator_agent import OrchestratorAgent
 from ..agents.ba_agent import BAAgent
 from ..agents.architect_agent import ArchitectAgent
@@ -33,6 +46,29 @@ configure_logging()
 logger = get_logger("mcp_server")
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode values JSON doesn't know natively: datetimes as ISO-8601, models as dicts, anything else as str."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return str(obj)
+
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """Serialise a WebSocket message as JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(message, default=_json_default).decode('utf-8')
+    return json.dumps(message, default=_json_default)
+
+
+def _loads(data: str) -> Any:
+    """Parse an incoming WebSocket frame, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Pydantic models for API
 class ProjectCreateRequest(BaseModel):
     specification: str
@@ -61,13 +97,18 @@ class WebSocketMessage(BaseModel):
 class AgenticEcosystemMCPServer:
     """Main MCP Server for the Agentic Ecosystem."""
     
+    # Agent type path values -> AgentType, so lookups don't go through Enum's value search
+    _AGENT_TYPE_MAP: ClassVar[Dict[str, AgentType]] = {t.value: t for t in AgentType}
+    
     def __init__(self, host: str = "0.0.0.0", port: int = 8000):
         self.host = host
         self.port = port
         self.app = FastAPI(
             title="Agentic Ecosystem MCP Server",
             description="Model Context Protocol server for agent-based software development",
-            version="1.0.0"
+            version="1.0.0",
+            # orjson renders responses in C and encodes datetimes natively
+            default_response_class=ORJSONResponse if orjson is not None else JSONResponse
         )
         
         # Configure CORS
@@ -140,19 +181,24 @@ class AgenticEcosystemMCPServer:
             """Health check endpoint."""
             agent_statuses = {}
             if self.agents:
-                for agent_type, agent in self.agents.items():
-                    try:
-                        status = await agent.get_status()
+                # Query every agent concurrently; the probe takes as long as the slowest agent
+                agent_items = list(self.agents.items())
+                statuses = await asyncio.gather(
+                    *(agent.get_status() for _, agent in agent_items),
+                    return_exceptions=True
+                )
+                for (agent_type, _), status in zip(agent_items, statuses):
+                    if isinstance(status, Exception):
+                        agent_statuses[agent_type.value] = {"status": "error", "error": str(status)}
+                    else:
                         agent_statuses[agent_type.value] = {
                             "status": status.status,
-                            "last_activity": status.last_activity.isoformat()
+                            "last_activity": status.last_activity
                         }
-                    except Exception as e:
-                        agent_statuses[agent_type.value] = {"status": "error", "error": str(e)}
             
             return {
                 "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "agents": agent_statuses
             }
         
@@ -165,11 +211,13 @@ class AgenticEcosystemMCPServer:
                 
                 project_id = await self.orchestrator.start_project(request.specification)
                 
-                return ProjectCreateResponse(
-                    project_id=project_id,
-                    status="created",
-                    message="Project created successfully and analysis started"
-                )
+                # A plain dict: response_model validates it once, where returning a
+                # ProjectCreateResponse would be validated a second time
+                return {
+                    "project_id": project_id,
+                    "status": "created",
+                    "message": "Project created successfully and analysis started"
+                }
                 
             except Exception as e:
                 logger.error(f"Error creating project: {str(e)}")
@@ -193,7 +241,7 @@ class AgenticEcosystemMCPServer:
                     "active_agents": [agent.value for agent in status.active_agents],
                     "next_actions": status.next_actions,
                     "issues": status.issues,
-                    "last_updated": status.last_updated.isoformat()
+                    "last_updated": status.last_updated
                 }
                 
             except HTTPException:
@@ -239,7 +287,7 @@ class AgenticEcosystemMCPServer:
                         "project_id": project_id,
                         "current_phase": status.current_phase,
                         "completion_percentage": status.completion_percentage,
-                        "last_updated": status.last_updated.isoformat()
+                        "last_updated": status.last_updated
                     })
                 
                 return {"projects": projects_list}
@@ -257,18 +305,26 @@ class AgenticEcosystemMCPServer:
                 
                 workflow = await self.orchestrator.get_project_workflow_history(project_id)
                 
-                workflow_data = []
-                for message in workflow:
-                    workflow_data.append({
+                workflow_data = [
+                    {
                         "id": message.id,
                         "from_agent": message.from_agent.value,
                         "to_agent": message.to_agent.value,
                         "message_type": message.message_type.value,
-                        "content": message.content[:200] + "..." if len(message.content) > 200 else message.content,
-                        "timestamp": message.timestamp.isoformat(),
+                        "content": message.content if len(message.content) <= 200 else message.content[:200] + "...",
+                        "timestamp": message.timestamp,
                         "metadata": message.metadata
-                    })
+                    }
+                    for message in workflow
+                ]
                 
+                if orjson is not None:
+                    # Long histories skip FastAPI's per-value jsonable_encoder walk;
+                    # orjson encodes the rows, datetimes included, in one call
+                    return Response(
+                        content=orjson.dumps({"workflow": workflow_data}, default=_json_default),
+                        media_type="application/json"
+                    )
                 return {"workflow": workflow_data}
                 
             except Exception as e:
@@ -285,38 +341,39 @@ class AgenticEcosystemMCPServer:
                 while True:
                     # Receive messages from client
                     data = await websocket.receive_text()
-                    message_data = json.loads(data)
+                    message_data = _loads(data)
                     
                     # Handle different message types
                     if message_data.get("type") == "subscribe_project":
                         project_id = message_data.get("project_id")
                         # Store subscription (in a real implementation)
-                        await websocket.send_text(json.dumps({
+                        await websocket.send_text(_dumps({
                             "type": "subscription_confirmed",
                             "project_id": project_id,
                             "message": f"Subscribed to project {project_id} updates"
                         }))
                     
                     elif message_data.get("type") == "ping":
-                        await websocket.send_text(json.dumps({
+                        await websocket.send_text(_dumps({
                             "type": "pong",
-                            "timestamp": datetime.now().isoformat()
+                            "timestamp": datetime.now()
                         }))
                 
             except WebSocketDisconnect:
-                if client_id in self.websocket_connections:
-                    del self.websocket_connections[client_id]
+                self.websocket_connections.pop(client_id, None)
                 logger.info(f"WebSocket client {client_id} disconnected")
             except Exception as e:
                 logger.error(f"WebSocket error for client {client_id}: {str(e)}")
-                if client_id in self.websocket_connections:
-                    del self.websocket_connections[client_id]
+                self.websocket_connections.pop(client_id, None)
         
         @self.app.get("/agents/{agent_type}/status")
         async def get_agent_status(agent_type: str):
             """Get status of a specific agent."""
             try:
-                agent_enum = AgentType(agent_type)
+                agent_enum = self._AGENT_TYPE_MAP.get(agent_type)
+                if agent_enum is None:
+                    raise HTTPException(status_code=400, detail="Invalid agent type")
+                
                 agent = self.agents.get(agent_enum)
                 
                 if not agent:
@@ -329,31 +386,33 @@ class AgenticEcosystemMCPServer:
                     "status": status.status,
                     "current_task": status.current_task,
                     "assigned_projects": status.assigned_projects,
-                    "last_activity": status.last_activity.isoformat()
+                    "last_activity": status.last_activity
                 }
                 
-            except ValueError:
-                raise HTTPException(status_code=400, detail="Invalid agent type")
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error getting agent status: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
     
     async def broadcast_to_websockets(self, message: Dict[str, Any]):
         """Broadcast message to all connected WebSocket clients."""
-        disconnected_clients = []
-        message_json = json.dumps(message)
+        message_json = _dumps(message)
         
-        for client_id, websocket in self.websocket_connections.items():
-            try:
-                await websocket.send_text(message_json)
-            except Exception as e:
-                logger.error(f"Error sending to WebSocket client {client_id}: {str(e)}")
-                disconnected_clients.append(client_id)
+        # Send to every client concurrently so one slow connection doesn't hold up the rest.
+        # The snapshot keeps connects/disconnects during the sends from affecting this round.
+        clients = tuple(self.websocket_connections.items())
+        results = await asyncio.gather(
+            *(websocket.send_text(message_json) for _, websocket in clients),
+            return_exceptions=True
+        )
         
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            if client_id in self.websocket_connections:
-                del self.websocket_connections[client_id]
+        # Clean up disconnected clients, unless the id has since reconnected on a new socket
+        for (client_id, websocket), result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to WebSocket client {client_id}: {str(result)}")
+                if self.websocket_connections.get(client_id) is websocket:
+                    del self.websocket_connections[client_id]
     
     async def run(self):
         """Run the MCP server."""
@@ -382,6 +441,16 @@ class AgenticEcosystemMCPServer:
             await self.stop_agents()
 
 
+def use_uvloop() -> None:
+    """Run the next asyncio.run() on uvloop when it is installed.
+    
+    server.serve() runs inside the caller's event loop, so uvicorn's own loop
+    setting never applies; the loop has to be chosen before asyncio.run().
+    """
+    if uvloop is not None:
+        uvloop.install()
+
+
 async def main():
     """Main entry point for the MCP server."""
     import os
@@ -394,4 +463,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    use_uvloop()
     asyncio.run(main())
@@ -8,6 +8,7 @@ agentic ecosystem through the enhanced MCP server.
 import asyncio
 import json
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -34,16 +35,24 @@ from langgraph_agents.workflow import SoftwareDevelopmentWorkflow
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Agentic Ecosystem Web Interface", version="1.0.0")
-
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
 # Global state
 project_manager = ProjectManager()
 active_connections: Dict[str, WebSocket] = {}
 active_workflows: Dict[str, asyncio.Task] = {}
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Write any debounced project save before the server exits."""
+    yield
+    await project_manager.flush_async()
+
+
+app = FastAPI(title="Agentic Ecosystem Web Interface", version="1.0.0", lifespan=lifespan)
+
+# Mount static files
+app.mount("/static", StaticFiles(directory="static"), name="static")
+
 # Pydantic models
 class ProjectRequest(BaseModel):
     title: str
@@ -141,7 +150,7 @@ async def create_project(project: ProjectRequest):
         project_id = str(uuid.uuid4())
         
         # Create project in project manager
-        await project_manager.create_project(
+        await project_manager.create_project_async(
             project_id=project_id,
             title=project.title,
             specification=project.specification
@@ -182,7 +191,7 @@ async def get_project_status(project_id: str):
 async def list_projects():
     """List all projects."""
     try:
-        projects = await project_manager.list_projects()
+        projects = await project_manager.list_projects_async()
         return JSONResponse({"projects": projects})
     except Exception as e:
         logger.error(f"Error listing projects: {e}")
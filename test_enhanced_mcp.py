@@ -189,7 +189,10 @@ async def test_enhanced_mcp_server():
                 artifacts_data = json.loads(artifacts_result[0].text)
                 print(f"✅ Retrieved {artifacts_data.get('artifact_count', 0)} artifacts")
                 
-                for artifact_name, artifact_data in artifacts_data.get('artifacts', {}).items():
+                # Each artifact arrives as its own content item after the header
+                for chunk in artifacts_result[1:]:
+                    artifact = json.loads(chunk.text)
+                    artifact_name, artifact_data = artifact["artifact"], artifact["data"]
                     if isinstance(artifact_data, dict):
                         keys = list(artifact_data.keys())[:3]  # Show first 3 keys
                         print(f"   - {artifact_name}: {keys}...")
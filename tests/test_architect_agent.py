@@ -407,7 +407,35 @@ class TestArchitectAgent:
             assert isinstance(result, dict)
             assert "error" in result
             assert "created_at" in result
-
+    
+    def test_only_validated_responses_are_cached(self, tmp_path):
+        """A malformed LLM reply is not cached; a validated one is."""
+        from langgraph_agents.llm_cache import LLMCache
+        
+        cache = LLMCache(tmp_path, ttl=60)
+        with patch('langgraph_agents.agent_tools.llm') as mock_llm, \
+                patch('langgraph_agents.agent_tools._llm_cache', cache):
+            mock_llm.model_name = "gpt-4"
+            mock_response = MagicMock()
+            mock_response.content = '{"components": ['
+            mock_response.response_metadata = {}
+            mock_llm.invoke.return_value = mock_response
+            
+            arguments = {
+                "user_stories": self.sample_user_stories,
+                "project_id": self.test_project_id,
+                "requirements": self.sample_requirements
+            }
+            design_system_architecture.invoke(arguments)
+            assert list(tmp_path.iterdir()) == []
+            
+            mock_response.content = json.dumps({
+                "technology_stack": {"frontend": "React"},
+                "complexity_analysis": "simple",
+                "components": []
+            })
+            design_system_architecture.invoke(arguments)
+            assert len(list(tmp_path.glob("*.json"))) == 1
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
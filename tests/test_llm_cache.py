@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test suite for the LLM response cache
+
+This module tests the file-backed LLMCache to ensure entries expire after
+their TTL, are written atomically and are skipped entirely when disabled.
+"""
+
+import pytest
+import json
+import sys
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from langgraph_agents.llm_cache import LLMCache
+
+
+class TestLLMCache:
+    """Test cases for the LLMCache implementation."""
+
+    def test_cache_disabled_when_ttl_is_zero(self, tmp_path):
+        """A TTL of zero disables the cache."""
+        cache = LLMCache(tmp_path, ttl=0)
+
+        assert cache.enabled is False
+        assert LLMCache(tmp_path, ttl=60).enabled is True
+
+    def test_set_and_get_round_trip(self, tmp_path):
+        """A stored response is returned within its TTL."""
+        cache = LLMCache(tmp_path, ttl=60)
+        key = cache.cache_key("gpt-4", "Design a todo app")
+
+        cache.set(key, '{"components": []}')
+
+        assert cache.get(key) == '{"components": []}'
+
+    def test_cache_key_depends_on_model_and_prompt(self):
+        """Keys are stable and differ per model and per prompt."""
+        key = LLMCache.cache_key("gpt-4", "prompt")
+
+        assert key == LLMCache.cache_key("gpt-4", "prompt")
+        assert key != LLMCache.cache_key("gpt-3.5-turbo", "prompt")
+        assert key != LLMCache.cache_key("gpt-4", "other prompt")
+
+    def test_get_missing_entry(self, tmp_path):
+        """A key that was never stored is a miss."""
+        cache = LLMCache(tmp_path, ttl=60)
+
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_removed_on_get(self, tmp_path):
+        """An entry older than the TTL is a miss and is deleted from disk."""
+        cache = LLMCache(tmp_path, ttl=60)
+        cache.set("key", "stale response")
+
+        with patch("langgraph_agents.llm_cache.time.time", return_value=time.time() + 120):
+            assert cache.get("key") is None
+
+        assert not (tmp_path / "key.json").exists()
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """An unreadable cache file is treated as a miss."""
+        cache = LLMCache(tmp_path, ttl=60)
+        (tmp_path / "key.json").write_text("{not json", encoding="utf-8")
+
+        assert cache.get("key") is None
+
+    def test_set_is_atomic(self, tmp_path):
+        """set() writes through a temporary file and leaves only the final entry."""
+        cache = LLMCache(tmp_path / "llm", ttl=60)
+
+        with patch("langgraph_agents.llm_cache.os.replace", wraps=os.replace) as mock_replace:
+            cache.set("key", "response")
+
+        mock_replace.assert_called_once()
+        src, dst = mock_replace.call_args.args
+        assert Path(src).suffix == ".tmp"
+        assert Path(dst) == tmp_path / "llm" / "key.json"
+
+        assert [p.name for p in (tmp_path / "llm").iterdir()] == ["key.json"]
+        entry = json.loads((tmp_path / "llm" / "key.json").read_text(encoding="utf-8"))
+        assert entry["content"] == "response"
+
+    def test_failed_write_keeps_previous_entry(self, tmp_path):
+        """If the final rename fails, readers still see the previous complete entry."""
+        cache = LLMCache(tmp_path, ttl=60)
+        cache.set("key", "first")
+
+        with patch("langgraph_agents.llm_cache.os.replace", side_effect=OSError("disk full")):
+            cache.set("key", "second")
+
+        assert cache.get("key") == "first"
+        assert [p.name for p in tmp_path.iterdir()] == ["key.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -138,6 +138,47 @@ class TestMCPServer:
         assert project1 in project_ids
         assert project2 in project_ids
     
+    @pytest.mark.asyncio
+    async def test_project_manager_indices_follow_updates(self):
+        """Test that status/domain indices stay correct through project updates."""
+        pm = ProjectManager()
+        
+        web_id = pm.create_project(specification="Project 1", title="Web", domain="web")
+        mobile_id = pm.create_project(specification="Project 2", title="Mobile", domain="mobile")
+        
+        assert [p["id"] for p in pm.list_projects(status="initiated", domain="web")] == [web_id]
+        
+        pm.update_project(web_id, {"status": "in_progress", "domain": "data"})
+        assert pm.list_projects(domain="web") == []
+        assert [p["id"] for p in pm.list_projects(status="in_progress", domain="data")] == [web_id]
+        assert [p["id"] for p in pm.list_projects(status="initiated")] == [mobile_id]
+        
+        await pm.update_project_status(mobile_id, "completed", progress=100)
+        assert pm.list_projects(status="initiated") == []
+        assert [p["id"] for p in pm.list_projects(status="completed", domain="mobile")] == [mobile_id]
+        assert pm.get_project(mobile_id)["progress"] == 100
+        
+        await pm.flush_async()
+    
+    @pytest.mark.asyncio
+    async def test_project_manager_flush_async_persists_debounced_save(self):
+        """Test that a debounced update reaches projects.json after flush_async."""
+        pm = ProjectManager()
+        
+        project_id = pm.create_project(
+            specification=self.sample_specification,
+            title="Debounced Project"
+        )
+        
+        # Inside a running event loop the write waits on the debounce
+        assert pm._save_handle is not None
+        
+        await pm.flush_async()
+        
+        assert pm._save_handle is None
+        saved_projects = json.loads(pm.projects_file.read_text(encoding="utf-8"))
+        assert saved_projects[project_id]["title"] == "Debounced Project"
+    
     @pytest.mark.asyncio
     async def test_handle_create_project_enhanced(self):
         """Test enhanced project creation handler."""
@@ -227,11 +268,9 @@ class TestMCPServer:
         
         with patch('langgraph_agents.enhanced_mcp_server.project_manager') as mock_pm:
             
-            # Mock projects data
+            # Mock projects data; list_projects filters through its indices
             mock_projects = [
-                {"id": "proj1", "title": "Project 1", "status": "completed", "domain": "web"},
-                {"id": "proj2", "title": "Project 2", "status": "in_progress", "domain": "mobile"},
-                {"id": "proj3", "title": "Project 3", "status": "failed", "domain": "web"}
+                {"id": "proj2", "title": "Project 2", "status": "in_progress", "domain": "mobile"}
             ]
             mock_pm.list_projects.return_value = mock_projects
             
@@ -250,7 +289,8 @@ class TestMCPServer:
             assert "total_count" in response_data
             assert "filters_applied" in response_data
             
-            # Should filter by status
+            # Filtering is delegated to the project manager
+            mock_pm.list_projects.assert_called_once_with(status="in_progress", domain=None)
             filtered_projects = response_data["projects"]
             assert len(filtered_projects) == 1  # Only one in_progress project
             assert filtered_projects[0]["id"] == "proj2"
@@ -205,16 +205,10 @@ class TestLangGraphWorkflow:
         for key in initial_state:
             assert key in ProjectState.__annotations__
     
-    @patch('langgraph_agents.workflow.Path')
-    def test_summary_report_generation(self, mock_path):
+    def test_summary_report_generation(self, tmp_path):
         """Test that summary reports are generated correctly."""
         workflow = SoftwareDevelopmentWorkflow()
         
-        # Mock file system
-        mock_dir = MagicMock()
-        mock_path.return_value.parent.parent.parent.__truediv__.return_value = mock_dir
-        mock_dir.mkdir.return_value = None
-        
         # Mock state with completed workflow
         state = {
             "project_id": self.test_project_id,
@@ -228,11 +222,16 @@ class TestLangGraphWorkflow:
             "errors": []
         }
         
-        # Test summary generation
-        workflow._generate_summary_report(state)
+        # Test summary generation into a temporary output root
+        with patch('langgraph_agents.workflow._OUT_ROOT', tmp_path):
+            workflow._generate_summary_report(state)
         
-        # Verify directory creation was attempted
-        mock_dir.mkdir.assert_called()
+        # Verify both report files were written
+        project_dir = tmp_path / f"project_{self.test_project_id}"
+        report = json.loads((project_dir / "project_summary.json").read_text(encoding="utf-8"))
+        assert report["project_id"] == self.test_project_id
+        assert report["summary"]["user_stories_count"] == 1
+        assert (project_dir / "project_summary.md").exists()
     
     def test_workflow_message_tracking(self):
         """Test that workflow properly tracks messages throughout execution."""